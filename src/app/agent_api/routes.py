@@ -14,7 +14,7 @@ from src.app.mcp.tools.meta_research_tools import get_format_archetypes
 from .graph import create_agent_graph
 from .graph import set_tool_catalog
 from .prompts import generate_welcome_message
-from .state import ConversationState, create_initial_state
+from .state import ConversationState, create_initial_state, summarize_state_for_ui
 from .store import InMemoryConversationStore
 from .streaming import (
     content_event,
@@ -169,13 +169,8 @@ async def get_conversation(conversation_id: str):
         raise HTTPException(status_code=404, detail="Conversation not found")
     return {
         "conversation_id": conversation_id,
-        "state": {
-            "format": convo["state"].get("format"),
-            "archetype": convo["state"].get("archetype"),
-            "days": convo["state"].get("days"),
-            # has_deck is true if user provided deck_text OR we have enriched card_details
-            "has_deck": bool(convo["state"].get("deck_text") or convo["state"].get("card_details")),
-        },
+        # Same snapshot as the final SSE state event of each /chat stream
+        "state": summarize_state_for_ui(convo["state"]),
         "messages": convo["state"].get("messages", []),
     }
 
@@ -220,6 +215,7 @@ async def chat(request: ChatRequest):
 
     def event_stream():
         current = conversation_store.get(convo["conversation_id"])["state"]
+        # metadata is always the first event so clients get the conversation_id up front
         yield metadata_event(convo["conversation_id"], current, tool_catalog=tool_catalog)
         yield thinking_event("Routing your request...")
         try:
@@ -270,5 +266,11 @@ async def chat(request: ChatRequest):
             yield state_event(final_state)
             yield done_event()
 
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
+    # Ask clients and reverse proxies (nginx honours X-Accel-Buffering) not to
+    # buffer the stream so each event is delivered as soon as it is yielded.
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
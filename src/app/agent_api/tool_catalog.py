@@ -22,23 +22,23 @@ async def fetch_tool_catalog() -> List[Dict[str, Any]]:
     server_name = os.getenv("MCP_SERVER_NAME") or os.getenv("MCP_SERVER_NAME", "mtg-meta-mage-mcp")
     server_port = os.getenv("MCP_SERVER_PORT") or os.getenv("MCP_SERVER_PORT", "8000")
     
-    logger.info(f"Fetching tool catalog: server_name={server_name}, server_port={server_port}")
+    logger.info("Fetching tool catalog: server_name=%s, server_port=%s", server_name, server_port)
     
     # Construct URL from port if MCP_SERVER_URL is not explicitly set
     server_url = os.getenv("MCP_SERVER_URL")
     if not server_url:
         server_url = f"http://localhost:{server_port}/mcp"
     
-    logger.info(f"Using MCP server URL: {server_url}")
+    logger.info("Using MCP server URL: %s", server_url)
 
     try:
         client = MultiServerMCPClient(
             {server_name: {"url": server_url, "transport": "streamable_http"}}
         )
-        logger.debug(f"Created MCP client for server: {server_name}")
+        logger.debug("Created MCP client for server: %s", server_name)
 
         tools = await client.get_tools()
-        logger.info(f"Retrieved {len(tools)} tools from MCP server")
+        logger.info("Retrieved %d tools from MCP server", len(tools))
 
         catalog: List[Dict[str, Any]] = []
         for tool in tools:
@@ -52,13 +52,13 @@ async def fetch_tool_catalog() -> List[Dict[str, Any]]:
                     "server": server_name,
                 }
             )
-            logger.debug(f"Added tool to catalog: {name}")
+            logger.debug("Added tool to catalog: %s", name)
 
         _catalog_cache = catalog
-        logger.info(f"Tool catalog cached with {len(catalog)} tools")
+        logger.info("Tool catalog cached with %d tools", len(catalog))
         return catalog
     except Exception as e:
-        logger.error(f"Error fetching tool catalog from MCP server: {e}", exc_info=True)
+        logger.error("Error fetching tool catalog from MCP server: %s", e, exc_info=True)
         raise
 
 
@@ -1,5 +1,6 @@
 """Scryfall API client with rate limiting and retry logic"""
 
+import os
 import time
 import requests
 from typing import Dict, List, Optional
@@ -15,6 +16,10 @@ class ScryfallClient:
     RATE_LIMIT_DELAY = 0.1  # 100ms between requests (50-100 req/sec limit)
     MAX_RETRIES = 3
     RETRY_DELAY = 1.0
+    REQUEST_TIMEOUT = (10, 60)  # (connect, read) seconds for API calls
+    DOWNLOAD_TIMEOUT = (30, 300)  # (connect, read) seconds for large bulk data files
+    # Bulk data files are saved under data/{data_type}/ in the src package (src/clients/ -> src/data/)
+    DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
     
     def __init__(self):
         self.last_request_time = 0.0
@@ -36,6 +41,7 @@ class ScryfallClient:
         for attempt in range(self.MAX_RETRIES):
             try:
                 self._rate_limit()
+                kwargs.setdefault('timeout', self.REQUEST_TIMEOUT)
                 response = self.session.request(method, url, **kwargs)
                 response.raise_for_status()
                 return response.json()
@@ -100,6 +106,9 @@ class ScryfallClient:
         """
         Download and parse Scryfall bulk data. Save locally to data/{data_type}/ folder.
         
+        Bulk files are named with their Scryfall snapshot timestamp, so when the file for
+        the current URL already exists locally it is loaded from disk instead of re-downloaded.
+        
         Returns structured data ready for database insertion. The 'data' field contains
         a list of card/ruling dictionaries that can be transformed using transform_card_to_db_row()
         or processed directly for database operations.
@@ -112,8 +121,8 @@ class ScryfallClient:
             Dictionary with 'data' (list of items) and 'file_path' keys, or None on error.
             The 'data' field contains structured JSON objects ready for transformation.
         """
-        import os
         import json
+        import tempfile
         from urllib.parse import urlparse
 
         if url is None:
@@ -122,10 +131,28 @@ class ScryfallClient:
         if not url:
             return None
         
+        # Extract filename from URL (e.g., oracle-cards-20251105100313.json)
+        parsed_url = urlparse(url)
+        filename = os.path.basename(parsed_url.path)
+        
+        # Save data locally under data/{data_type}/ folder
+        data_folder = os.path.join(self.DATA_DIR, data_type)
+        file_path = os.path.join(data_folder, filename)
+        
+        # Bulk files are timestamped, so an existing file is the same snapshot
+        if os.path.exists(file_path):
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    items = json.load(f)
+                logger.info(f"Loaded {len(items)} {data_type} from cached file {file_path}")
+                return {"data": items, "file_path": file_path}
+            except Exception as load_e:
+                logger.warning(f"Failed to read cached {data_type} from {file_path}, re-downloading: {load_e}")
+        
         try:
             logger.info(f"Downloading {data_type} from {url}")
-            # Add timeout to prevent hanging (30 seconds connect, 300 seconds read for large files)
-            response = requests.get(url, stream=True, timeout=(30, 300))
+            # Add timeout to prevent hanging on a dead connection
+            response = requests.get(url, stream=True, timeout=self.DOWNLOAD_TIMEOUT)
             response.raise_for_status()
             
             # Parse JSON data
@@ -141,24 +168,19 @@ class ScryfallClient:
             
             logger.info(f"Downloaded {len(items)} {data_type}")
             
-            # Extract filename from URL (e.g., oracle-cards-20251105100313.json)
-            parsed_url = urlparse(url)
-            filename = os.path.basename(parsed_url.path)
-            
-            # Save data locally under data/{data_type}/ folder
-            # Use project root relative to this file (src/clients/ -> src/../data/)
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            data_folder = os.path.join(project_root, 'data', data_type)
+            # Save with the original timestamped filename. Write to a temporary file and
+            # rename it into place so concurrent readers never see a partial file.
             os.makedirs(data_folder, exist_ok=True)
-            
-            # Save with the original timestamped filename
-            file_path = os.path.join(data_folder, filename)
+            fd, tmp_path = tempfile.mkstemp(dir=data_folder, prefix=f".{filename}.", suffix=".tmp")
             try:
-                with open(file_path, "w", encoding="utf-8") as f:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
                     json.dump(items, f)
+                os.replace(tmp_path, file_path)
                 logger.info(f"{data_type} saved to {file_path}")
             except Exception as save_e:
                 logger.error(f"Failed to save {data_type} to {file_path}: {save_e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
                 return None
 
             return {"data": items, "file_path": file_path}
@@ -19,6 +19,7 @@ class TopDeckClient:
     RATE_LIMIT_DELAY = 0.3  # 300ms between requests (200 req/min limit = 300ms per request)
     MAX_RETRIES = 3
     RETRY_DELAY = 1.0
+    REQUEST_TIMEOUT = (10, 60)  # (connect, read) seconds
     
     def __init__(self, api_key: Optional[str] = None):
         """
@@ -64,6 +65,7 @@ class TopDeckClient:
         for attempt in range(self.MAX_RETRIES):
             try:
                 self._rate_limit()
+                kwargs.setdefault('timeout', self.REQUEST_TIMEOUT)
                 response = self.session.request(method, url, **kwargs)
                 response.raise_for_status()
                 return response.json()
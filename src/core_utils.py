@@ -9,6 +9,21 @@ from Levenshtein import distance as levenshtein_distance
 
 logger = logging.getLogger(__name__)
 
+# Deck parsing patterns, compiled once at import time rather than on every parse_deck call
+# Sideboard separators that appear on their own line
+_SIDEBOARD_ONLY_PATTERNS = (
+    re.compile(r'^\s*sideboard\s*:?\s*$', re.IGNORECASE),
+    re.compile(r'^\s*//\s*sideboard\s*$', re.IGNORECASE),
+    re.compile(r'^\s*~~\s*sideboard\s*~~\s*$', re.IGNORECASE),  # TopDeck format
+)
+# Mainboard section marker (TopDeck format) - skip but don't change section
+_MAINBOARD_PATTERN = re.compile(r'^\s*~~\s*mainboard\s*~~\s*$', re.IGNORECASE)
+# SB: prefix that may have a card after it
+_SB_PREFIX_PATTERN = re.compile(r'^\s*sb\s*:\s*(.*)$', re.IGNORECASE)
+# Card line: quantity (1+ digits) followed by whitespace and card name
+_CARD_PATTERN = re.compile(r'^(\d+)\s+(.+)$')
+_WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+
 
 def normalize_card_name(card_name: str) -> str:
     """
@@ -73,7 +88,7 @@ def normalize_card_name(card_name: str) -> str:
     card_name = card_name.replace('\t', ' ')      # Tab to space
     
     # Collapse multiple spaces to single space
-    card_name = re.sub(r'\s+', ' ', card_name)
+    card_name = _WHITESPACE_RUN_PATTERN.sub(' ', card_name)
     
     # 5. Strip leading/trailing whitespace
     card_name = card_name.strip()
@@ -118,22 +133,6 @@ def parse_deck(deck_text: str) -> List[Dict[str, any]]:
     lines = deck_text.split('\n')
     logger.debug(f"Parsing deck with {len(lines)} lines")
     
-    # Patterns for sideboard detection
-    sideboard_only_patterns = [
-        re.compile(r'^\s*sideboard\s*:?\s*$', re.IGNORECASE),
-        re.compile(r'^\s*//\s*sideboard\s*$', re.IGNORECASE),
-        re.compile(r'^\s*~~\s*sideboard\s*~~\s*$', re.IGNORECASE),  # TopDeck format
-    ]
-    
-    # Pattern for mainboard section (TopDeck format) - skip but don't change section
-    mainboard_pattern = re.compile(r'^\s*~~\s*mainboard\s*~~\s*$', re.IGNORECASE)
-    
-    # Pattern for SB: prefix that may have card after it
-    sb_prefix_pattern = re.compile(r'^\s*sb\s*:\s*(.*)$', re.IGNORECASE)
-    
-    # Pattern for card line: quantity (1+ digits) followed by whitespace and card name
-    card_pattern = re.compile(r'^(\d+)\s+(.+)$')
-    
     for line in lines:
         line = line.strip()
         
@@ -142,12 +141,12 @@ def parse_deck(deck_text: str) -> List[Dict[str, any]]:
             continue
         
         # Skip mainboard marker (TopDeck format)
-        if mainboard_pattern.match(line):
+        if _MAINBOARD_PATTERN.match(line):
             current_section = "mainboard"
             continue
         
         # Check for SB: prefix (may have card on same line)
-        sb_match = sb_prefix_pattern.match(line)
+        sb_match = _SB_PREFIX_PATTERN.match(line)
         if sb_match:
             current_section = "sideboard"
             # If there's content after SB:, process it as a card line
@@ -159,7 +158,7 @@ def parse_deck(deck_text: str) -> List[Dict[str, any]]:
         
         # Check for sideboard-only separators (standalone)
         is_sideboard_separator = False
-        for pattern in sideboard_only_patterns:
+        for pattern in _SIDEBOARD_ONLY_PATTERNS:
             if pattern.match(line):
                 current_section = "sideboard"
                 is_sideboard_separator = True
@@ -173,7 +172,7 @@ def parse_deck(deck_text: str) -> List[Dict[str, any]]:
             continue
         
         # Try to match card pattern: quantity + card name
-        match = card_pattern.match(line)
+        match = _CARD_PATTERN.match(line)
         if match:
             quantity = int(match.group(1))
             card_name = match.group(2).strip()
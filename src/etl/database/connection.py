@@ -2,6 +2,7 @@
 
 import os
 import logging
+from functools import lru_cache
 from contextlib import contextmanager
 from typing import Optional, Generator
 import psycopg2
@@ -20,22 +21,31 @@ class DatabaseConnection:
     _connection_pool: Optional[pool.ThreadedConnectionPool] = None
     _current_database: Optional[str] = None
     
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _cached_connection_params(cls, database: Optional[str] = None) -> dict:
+        """Read connection parameters from the environment, cached per database"""
+        return {
+            'host': os.getenv('DB_HOST', 'localhost'),
+            'port': int(os.getenv('DB_PORT', 5432)),
+            'database': database or os.getenv('DB_NAME'),
+            'user': os.getenv('DB_USER'),
+            'password': os.getenv('DB_PASSWORD'),
+        }
+    
     @classmethod
     def _get_connection_params(cls, database: Optional[str] = None) -> dict:
         """
         Get database connection parameters from environment variables
         
+        Results are cached per database until initialize_pool() or close_pool()
+        is called. Each call returns its own copy, so callers may modify it.
+        
         Args:
             database: Optional database name. If None, uses DB_NAME from environment.
                      Use 'postgres' to connect to default PostgreSQL database.
         """
-        return {
-            'host': os.getenv('DB_HOST', 'localhost'),
-            'port': int(os.getenv('DB_PORT', 5432)),
-            'database': database or os.getenv('DB_NAME'),
-            'user': os.getenv('DB_USER'),
-            'password': os.getenv('DB_PASSWORD'),
-        }
+        return dict(cls._cached_connection_params(database))
     
     @classmethod
     def initialize_pool(cls, database: Optional[str] = None, min_conn: int = 1, max_conn: int = 10) -> None:
@@ -48,6 +58,9 @@ class DatabaseConnection:
             min_conn: Minimum number of connections in pool
             max_conn: Maximum number of connections in pool
         """
+        # Re-read connection settings so environment changes since the last call are seen
+        cls._cached_connection_params.cache_clear()
+        
         # Determine target database
         target_database = database or os.getenv('DB_NAME')
         
@@ -125,9 +138,9 @@ class DatabaseConnection:
         conn = None
         try:
             conn = cls.get_connection()
-            cur = conn.cursor()
-            logger.debug("Database cursor created")
-            yield cur
+            with conn.cursor() as cur:
+                logger.debug("Database cursor created")
+                yield cur
             if commit:
                 logger.debug("Committing transaction")
                 conn.commit()
@@ -142,7 +155,6 @@ class DatabaseConnection:
             raise
         finally:
             if conn:
-                cur.close()
                 logger.debug("Cursor closed, returning connection to pool")
                 cls.return_connection(conn)
     
@@ -176,7 +188,8 @@ class DatabaseConnection:
     
     @classmethod
     def close_pool(cls) -> None:
-        """Close all connections in the pool"""
+        """Close all connections in the pool and drop cached connection parameters"""
+        cls._cached_connection_params.cache_clear()
         if cls._connection_pool is not None:
             cls._connection_pool.closeall()
             cls._connection_pool = None
@@ -207,10 +220,9 @@ class DatabaseConnection:
             conn = None
             try:
                 conn = psycopg2.connect(**params)
-                cur = conn.cursor()
-                cur.execute(schema_sql)
+                with conn.cursor() as cur:
+                    cur.execute(schema_sql)
                 conn.commit()
-                cur.close()
                 logger.info(f"Schema file executed: {schema_file_path} on database: {database}")
             except Exception as e:
                 if conn:
@@ -223,9 +235,8 @@ class DatabaseConnection:
         else:
             # Use connection pool for default database
             with cls.transaction() as conn:
-                cur = conn.cursor()
-                cur.execute(schema_sql)
-                cur.close()
+                with conn.cursor() as cur:
+                    cur.execute(schema_sql)
             
             logger.info(f"Schema file executed: {schema_file_path}")
     
@@ -248,25 +259,23 @@ class DatabaseConnection:
         if missing_params:
             raise ValueError(f"Missing required database parameters: {', '.join(missing_params)}")
         
+        conn = None
         try:
             conn = psycopg2.connect(**params)
             conn.autocommit = True
-            cur = conn.cursor()
-            
-            # Check if database exists
-            cur.execute(
-                "SELECT 1 FROM pg_database WHERE datname = %s",
-                (database_name,)
-            )
-            exists = cur.fetchone() is not None
-            
-            cur.close()
-            conn.close()
-            
-            return exists
+            with conn.cursor() as cur:
+                # Check if database exists
+                cur.execute(
+                    "SELECT 1 FROM pg_database WHERE datname = %s",
+                    (database_name,)
+                )
+                return cur.fetchone() is not None
         except Exception as e:
             logger.error(f"Failed to check if database exists: {e}")
             raise
+        finally:
+            if conn:
+                conn.close()
     
     @classmethod
     def create_database(cls, database_name: str) -> None:
@@ -288,23 +297,23 @@ class DatabaseConnection:
         if missing_params:
             raise ValueError(f"Missing required database parameters: {', '.join(missing_params)}")
         
+        conn = None
         try:
             conn = psycopg2.connect(**params)
             conn.autocommit = True
-            cur = conn.cursor()
-            
-            # Create database
-            cur.execute(sql.SQL("CREATE DATABASE {}").format(
-                sql.Identifier(database_name)
-            ))
-            
-            cur.close()
-            conn.close()
+            with conn.cursor() as cur:
+                # Create database
+                cur.execute(sql.SQL("CREATE DATABASE {}").format(
+                    sql.Identifier(database_name)
+                ))
             
             logger.info(f"Database '{database_name}' created successfully")
         except Exception as e:
             logger.error(f"Failed to create database '{database_name}': {e}")
             raise
+        finally:
+            if conn:
+                conn.close()
     
     @classmethod
     def drop_database(cls, database_name: str) -> None:
@@ -326,30 +335,31 @@ class DatabaseConnection:
         if missing_params:
             raise ValueError(f"Missing required database parameters: {', '.join(missing_params)}")
         
+        conn = None
         try:
             conn = psycopg2.connect(**params)
             conn.autocommit = True
-            cur = conn.cursor()
+            with conn.cursor() as cur:
+                # Terminate existing connections to the database
+                cur.execute(sql.SQL("""
+                    SELECT pg_terminate_backend(pg_stat_activity.pid)
+                    FROM pg_stat_activity
+                    WHERE pg_stat_activity.datname = %s
+                    AND pid <> pg_backend_pid()
+                """), [database_name])
+                
+                # Drop database
+                cur.execute(sql.SQL("DROP DATABASE {}").format(
+                    sql.Identifier(database_name)
+                ))
             
-            # Terminate existing connections to the database
-            cur.execute(sql.SQL("""
-                SELECT pg_terminate_backend(pg_stat_activity.pid)
-                FROM pg_stat_activity
-                WHERE pg_stat_activity.datname = %s
-                AND pid <> pg_backend_pid()
-            """), [database_name])
-            
-            # Drop database
-            cur.execute(sql.SQL("DROP DATABASE {}").format(
-                sql.Identifier(database_name)
-            ))
-            
-            cur.close()
-            conn.close()
             logger.info(f"Database '{database_name}' dropped successfully")
         except Exception as e:
             logger.error(f"Failed to drop database '{database_name}': {e}")
             raise
+        finally:
+            if conn:
+                conn.close()
     
     @classmethod
     def ensure_database_exists(cls, database_name: str) -> None:
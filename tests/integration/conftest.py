@@ -1,15 +1,25 @@
 """Pytest configuration and fixtures for integration tests"""
 
+import asyncio
 import os
+import sys
+from contextlib import contextmanager
 import pytest
 import logging
 from pathlib import Path
+from dotenv import load_dotenv
+from filelock import FileLock, Timeout
+
+# Load environment variables from .env file once for every integration test module
+load_dotenv()
 
 from src.etl.database.connection import DatabaseConnection
 from src.etl.cards_pipeline import CardsPipeline
 from src.etl.tournaments_pipeline import TournamentsPipeline
 from src.etl.archetype_pipeline import ArchetypeClassificationPipeline
 
+from tests.integration.helpers import scalar
+
 logger = logging.getLogger(__name__)
 
 # Thresholds for test data requirements
@@ -17,6 +27,19 @@ REQUIRED_CARDS = 36100
 REQUIRED_TOURNAMENTS = 100
 REQUIRED_ARCHETYPES = 10
 
+# Longest an xdist worker waits for another worker's test data load, in seconds.
+# Enforced by the lock itself rather than SIGALRM, so it is safe in any worker thread.
+TEST_DATA_LOCK_TIMEOUT = int(os.getenv('MTG_TESTS_LOAD_TIMEOUT', 3600))
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async integration tests on uvloop, which reads streamed responses with less overhead"""
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+    import uvloop
+    return uvloop.EventLoopPolicy()
+
 
 @pytest.fixture(scope="session")
 def test_database():
@@ -51,12 +74,106 @@ def test_database():
     DatabaseConnection.close_pool()
 
 
+@pytest.fixture
+def db_savepoint(test_database):
+    """
+    Provide a pooled connection whose writes are discarded after the test.
+
+    The test runs inside a SAVEPOINT that is rolled back on teardown, so nothing
+    is committed and no cleanup DELETE/TRUNCATE is needed. Only suitable for code
+    that accepts a caller-supplied connection; pipelines that commit on their
+    own connections still persist their writes.
+    """
+    conn = DatabaseConnection.get_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SAVEPOINT test_isolation")
+        yield conn
+    finally:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("ROLLBACK TO SAVEPOINT test_isolation")
+        finally:
+            conn.rollback()
+            DatabaseConnection.return_connection(conn)
+
+
 @pytest.fixture(scope="session")
-def load_test_data(test_database):
+def cards_pipeline(test_database):
+    """Shared CardsPipeline instance (stateless, so safe to reuse across tests)"""
+    return CardsPipeline()
+
+
+@contextmanager
+def _test_data_lock(tmp_path_factory):
+    """
+    Hold the file lock that serializes bulk test data loads across xdist workers.
+    
+    Every worker runs the session fixtures, so whichever worker gets the lock
+    first does the load, and the others then find the data in place.
+    """
+    lock_path = tmp_path_factory.getbasetemp().parent / "load_test_data.lock"
+    try:
+        with FileLock(str(lock_path), timeout=TEST_DATA_LOCK_TIMEOUT):
+            yield
+    except Timeout:
+        pytest.fail(
+            f"Timed out after {TEST_DATA_LOCK_TIMEOUT}s waiting for another worker to load test data "
+            f"(lock: {lock_path}). Raise MTG_TESTS_LOAD_TIMEOUT if the initial load is slow."
+        )
+
+
+@pytest.fixture(scope="session")
+def scryfall_cards_loaded(test_database, cards_pipeline, tmp_path_factory):
+    """
+    Load the full Scryfall card set into the test database once per session.
+
+    Tests that need a populated cards table share this result instead of each
+    downloading, joining, and inserting the bulk data themselves.
+
+    If the test database already holds at least REQUIRED_CARDS cards the load is
+    skipped and the result is marked 'reused'. Set MTG_TESTS_REUSE_CARDS=0 to
+    always reload from Scryfall. The check and load run under the test data
+    lock, so workers never bulk-load cards at the same time.
+    """
+    with _test_data_lock(tmp_path_factory):
+        if os.getenv('MTG_TESTS_REUSE_CARDS', '1') == '1':
+            with DatabaseConnection.get_cursor() as cur:
+                card_count = scalar(cur, "SELECT COUNT(*) FROM cards")
+            if card_count >= REQUIRED_CARDS:
+                logger.info(f"Reusing {card_count} cards already in test database, skipping Scryfall load")
+                return {'cards_loaded': card_count, 'cards_processed': 0, 'errors': 0, 'reused': True}
+        
+        result = cards_pipeline.insert_cards(batch_size=1000, update_existing=True)
+    logger.info(
+        f"Scryfall cards loaded for session: loaded={result['cards_loaded']}, "
+        f"processed={result['cards_processed']}, errors={result['errors']}"
+    )
+    return result
+
+
+@pytest.fixture(scope="session")
+def load_test_data(test_database, tmp_path_factory):
     """
     Load test data (cards, tournaments, archetypes) for integration tests.
     
-    This fixture runs once per test session and:
+    Under pytest-xdist every worker runs this session fixture, so loading is
+    serialized with a file lock shared by all workers: the first worker loads
+    and the rest find sufficient data already present and skip loading.
+    """
+    with _test_data_lock(tmp_path_factory):
+        _ensure_test_data()
+    
+    yield
+    
+    # Data persists for other tests in the session
+
+
+def _ensure_test_data():
+    """
+    Load test data (cards, tournaments, archetypes) into the test database.
+    
+    This runs once per test session (per worker) and:
     - Skips loading if sufficient data already exists
     - Uses load_initial() if no data exists
     - Uses load_incremental() if data exists but is insufficient
@@ -75,14 +192,11 @@ def load_test_data(test_database):
     
     # Check current data counts
     with DatabaseConnection.get_cursor() as cur:
-        cur.execute("SELECT COUNT(*) FROM cards")
-        card_count = cur.fetchone()[0]
+        card_count = scalar(cur, "SELECT COUNT(*) FROM cards")
         
-        cur.execute("SELECT COUNT(*) FROM tournaments")
-        tournament_count = cur.fetchone()[0]
+        tournament_count = scalar(cur, "SELECT COUNT(*) FROM tournaments")
         
-        cur.execute("SELECT COUNT(*) FROM archetype_groups")
-        archetype_count = cur.fetchone()[0]
+        archetype_count = scalar(cur, "SELECT COUNT(*) FROM archetype_groups")
     
     # 1. Load cards
     logger.info("Step 1/3: Loading cards...")
@@ -193,8 +307,7 @@ def load_test_data(test_database):
     logger.info("Verifying test data requirements...")
     with DatabaseConnection.get_cursor() as cur:
         # Verify cards
-        cur.execute("SELECT COUNT(*) FROM cards")
-        final_card_count = cur.fetchone()[0]
+        final_card_count = scalar(cur, "SELECT COUNT(*) FROM cards")
         assert final_card_count >= REQUIRED_CARDS, (
             f"Only {final_card_count} cards found, but tests require at least {REQUIRED_CARDS} cards. "
             "Card loading failed or insufficient cards loaded. Check Scryfall API access."
@@ -208,16 +321,14 @@ def load_test_data(test_database):
                 "Tests require tournaments. Set TOPDECK_API_KEY to enable tournament loading."
             )
         
-        cur.execute("SELECT COUNT(*) FROM tournaments")
-        final_tournament_count = cur.fetchone()[0]
+        final_tournament_count = scalar(cur, "SELECT COUNT(*) FROM tournaments")
         assert final_tournament_count >= REQUIRED_TOURNAMENTS, (
             f"Only {final_tournament_count} tournaments found, but tests require at least {REQUIRED_TOURNAMENTS} tournaments. "
             "Tournament loading failed or insufficient tournaments loaded. Check TopDeck API key and access."
         )
         logger.info(f"Tournaments: {final_tournament_count} (required: {REQUIRED_TOURNAMENTS})")
         
-        cur.execute("SELECT COUNT(*) FROM decklists")
-        decklist_count = cur.fetchone()[0]
+        decklist_count = scalar(cur, "SELECT COUNT(*) FROM decklists")
         assert decklist_count > 0, (
             "No decklists found. Tournaments loaded but decklists are missing. "
             "Check tournament data loading."
@@ -225,8 +336,7 @@ def load_test_data(test_database):
         logger.info(f"Decklists: {decklist_count}")
         
         # Verify archetypes
-        cur.execute("SELECT COUNT(*) FROM archetype_groups")
-        final_archetype_count = cur.fetchone()[0]
+        final_archetype_count = scalar(cur, "SELECT COUNT(*) FROM archetype_groups")
         
         if final_archetype_count == 0:
             if large_language_model:
@@ -254,10 +364,6 @@ def load_test_data(test_database):
     logger.info("=" * 80)
     logger.info("Test data loading complete")
     logger.info("=" * 80)
-    
-    yield
-    
-    # Data persists for other tests in the session
 
 
 # @pytest.fixture(autouse=True)
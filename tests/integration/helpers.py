@@ -0,0 +1,43 @@
+"""Shared helpers for integration tests
+
+Kept out of conftest.py so test modules can import them under any pytest
+import mode.
+"""
+
+# Modern Murktide decklist shared by the agent API and MCP deck coaching tests
+SAMPLE_MURKTIDE_DECK = """4 Lightning Bolt
+4 Ragavan, Nimble Pilferer
+4 Dragon's Rage Channeler
+4 Murktide Regent
+4 Counterspell
+4 Consider
+4 Expressive Iteration
+2 Spell Pierce
+2 Unholy Heat
+2 Subtlety
+1 Brazen Borrower
+1 Jace, the Mind Sculptor
+4 Scalding Tarn
+4 Flooded Strand
+2 Steam Vents
+2 Volcanic Island
+1 Mountain
+1 Island
+4 Misty Rainforest
+4 Polluted Delta
+
+Sideboard:
+2 Engineered Explosives
+2 Relic of Progenitus
+2 Blood Moon
+2 Dress Down
+2 Subtlety
+2 Flusterstorm
+1 Brazen Borrower
+2 Surgical Extraction"""
+
+
+def scalar(cur, query, params=None):
+    """Execute a query and return the first column of its first row"""
+    cur.execute(query, params)
+    return cur.fetchone()[0]
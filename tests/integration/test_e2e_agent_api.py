@@ -1,119 +1,291 @@
 """End-to-end integration tests for Agent API with real data and external APIs"""
 
 import os
+import asyncio
 import pytest
 import logging
-import json
-from typing import Dict, List
-from dotenv import load_dotenv
+import orjson
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 import httpx
+import pytest_asyncio
 import re
 
-# Load environment variables from .env file
-load_dotenv()
+from tests.integration.helpers import SAMPLE_MURKTIDE_DECK
 
 logger = logging.getLogger(__name__)
 
-
-def parse_sse_stream(response_text: str) -> List[Dict[str, str]]:
-    """Parse SSE stream into list of events."""
-    events = []
-    current_event = {}
-    for line in response_text.split("\n"):
-        if line.startswith("event:"):
-            current_event["event"] = line[6:].strip()
-        elif line.startswith("data:"):
-            current_event["data"] = line[5:].strip()
-            events.append(current_event.copy())
-            current_event = {}
-    return events
+# /chat bodies are serialized with orjson and sent as raw content
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Context for a Murktide deck coaching turn
+DECK_COACHING_CONTEXT = {
+    "format": "Modern",
+    "archetype": "Murktide",
+    "deck_text": SAMPLE_MURKTIDE_DECK,
+}
+
+# Blocking dependency scenarios: (scenario, message, context, any/all, terms the
+# first content event must mention)
+BLOCKING_SCENARIOS = [
+    # Format is required before proceeding
+    ("format_required", "What are the top decks?", {}, any, ("format", "required")),
+    # Days is required for the meta research workflow
+    ("days_required", "Show me the Modern meta", {"format": "Modern"}, any, ("days", "required")),
+    # Deck is required for the deck coaching workflow
+    (
+        "deck_required",
+        "Optimize my sideboard",
+        {"format": "Modern", "archetype": "Murktide"},
+        any,
+        ("deck", "required"),
+    ),
+    # deck_text that was not enriched via get_enriched_deck (no card_details) blocks
+    # with "Please provide your deck list so I can enrich it first."
+    (
+        "deck_enrichment_required",
+        "Optimize my mainboard",
+        {"format": "Modern", "deck_text": SAMPLE_MURKTIDE_DECK},
+        all,
+        ("deck", "enrich"),
+    ),
+]
+
+# Matches an SSE "event:" or "data:" field line in raw bytes, capturing the field and
+# its value. The value is matched greedily up to the line ending, so there is no
+# backtracking to strip trailing whitespace.
+_SSE_FIELD_RE = re.compile(rb"(event|data):[ \t]*([^\r\n]*)")
+
+# Every test shares the module-scoped client below, so they must also share its event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    """Base URL for agent API. Defaults to port 8001 per README."""
+    return os.getenv("AGENT_API_BASE_URL", "http://localhost:8001")
+
+
+@pytest.fixture(scope="module")
+def agent_api_ready(base_url):
+    """Check once that the agent API is up before any test talks to it.
+
+    Probes the cheap /formats endpoint. pytest caches a module-scoped fixture's
+    failure, so when the server is down every test errors immediately instead
+    of each waiting out the client's 30s timeout.
+    """
+    try:
+        httpx.get(f"{base_url}/formats", timeout=5.0).raise_for_status()
+    except httpx.HTTPError as e:
+        pytest.fail(f"Agent API at {base_url} is not reachable: {e}", pytrace=False)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(base_url, agent_api_ready):
+    """HTTP client shared by every test in the module so keep-alive connections are reused."""
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30.0),
+    ) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def welcome_data(client):
+    """GET /welcome once for tests that only inspect the payload.
+
+    Tests that chat on the welcome conversation call /welcome themselves so
+    each gets its own session.
+    """
+    response = await client.get("/welcome")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def modern_conversation(client):
+    """Start a fresh Modern meta research conversation for each test.
+
+    Returns the /chat response and its SSEStream. Each test gets its own
+    conversation, so a test that continues it cannot change the state another
+    test checks, whatever order the tests run in.
+    """
+    return await stream_chat(
+        client,
+        {
+            "message": "What are the top decks in Modern?",
+            "conversation_id": None,
+            "context": {"format": "Modern", "days": 30},
+        },
+    )
+
+
+def _decode_sse_data(value: bytes) -> Any:
+    """Decode an SSE data payload once; non-JSON payloads are kept as text."""
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return value.decode()
+
+
+async def aiter_sse(response: httpx.Response) -> AsyncIterator[Dict[str, Any]]:
+    """Yield SSE events from a streaming response as they arrive, with data decoded.
+
+    Lines are split out of the raw bytes so data payloads go straight to orjson
+    without first being decoded to str.
+    """
+    buffer = bytearray()
+    event_type = None
+    async for chunk in response.aiter_bytes():
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            match = _SSE_FIELD_RE.match(buffer, start, end)
+            start = end + 1
+            if match is None:
+                continue
+            name, value = match.groups()
+            if name == b"event":
+                event_type = value.decode()
+            else:
+                yield {"event": event_type, "data": _decode_sse_data(value)}
+                event_type = None
+        del buffer[:start]
+
+
+@dataclass
+class SSEStream:
+    """SSE events from one response, in stream order and grouped by event type."""
+
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    by_type: Dict[str, List[Dict[str, Any]]] = field(default_factory=lambda: defaultdict(list))
+
+    def add(self, event: Dict[str, Any]) -> None:
+        self.events.append(event)
+        self.by_type[event["event"]].append(event)
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        """Conversation state from the last state event, as GET /conversations/{id} reports it."""
+        return self.by_type["state"][-1]["data"]
+
+
+async def stream_chat(client: httpx.AsyncClient, payload: Dict) -> Tuple[httpx.Response, SSEStream]:
+    """POST /chat and collect its SSE events as they stream in, without buffering the body."""
+    stream = SSEStream()
+    async with client.stream("POST", "/chat", content=orjson.dumps(payload), headers=JSON_HEADERS) as response:
+        async for event in aiter_sse(response):
+            stream.add(event)
+    return response, stream
+
+
+async def chat_turn(
+    client: httpx.AsyncClient, conversation_id: Optional[str], message: str, context: Dict
+) -> Tuple[str, Dict]:
+    """Send one chat message and drain its stream.
+
+    Returns the conversation_id and the conversation state from the stream's
+    final state event, the same snapshot GET /conversations/{id} returns.
+    """
+    response, stream = await stream_chat(
+        client,
+        {"message": message, "conversation_id": conversation_id, "context": context},
+    )
+    assert response.status_code == 200
+    metadata = stream.by_type["metadata"][0]["data"]
+    return metadata["conversation_id"], stream.state
+
+
+async def first_chat_event(
+    client: httpx.AsyncClient, payload: Dict, event_type: str
+) -> Tuple[httpx.Response, Optional[Dict[str, Any]]]:
+    """POST /chat and return the first SSE event of ``event_type``.
+
+    The stream is closed as soon as that event arrives, so the rest of the
+    stream is never read. The server has already run the agent by then, so
+    this only skips the trailing events. Returns ``None`` for the event if
+    the stream ends without one.
+    """
+    async with client.stream("POST", "/chat", content=orjson.dumps(payload), headers=JSON_HEADERS) as response:
+        async for event in aiter_sse(response):
+            if event["event"] == event_type:
+                return response, event
+    return response, None
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group(name="agent_api_conversation_flow")
 class TestAgentAPIFullConversationFlow:
     """E2E integration tests for full conversation flow"""
 
-    @pytest.fixture
-    def base_url(self):
-        """Base URL for agent API. Defaults to port 8001 per README."""
-        return os.getenv("AGENT_API_BASE_URL", "http://localhost:8001")
-
-    @pytest.fixture
-    async def client(self, base_url):
-        """HTTP client for making requests."""
-        async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
-            yield client
-
-    async def test_new_conversation_flow(self, client, load_test_data):
+    @pytest.mark.integration_slow
+    async def test_new_conversation_flow(self, client, welcome_data, modern_conversation, load_test_data):
         """Test starting a new conversation with format and meta research query."""
         # Step 1: Get welcome information
-        welcome_response = await client.get("/welcome")
-        assert welcome_response.status_code == 200
-        welcome_data = welcome_response.json()
         assert "available_formats" in welcome_data
         assert "workflows" in welcome_data
         assert len(welcome_data["available_formats"]) > 0
 
         # Step 2: Start conversation with format context
-        chat_response = await client.post(
-            "/chat",
-            json={
-                "message": "What are the top decks in Modern?",
-                "conversation_id": None,
-                "context": {"format": "Modern", "days": 30},
-            },
-        )
+        chat_response, stream = modern_conversation
         assert chat_response.status_code == 200
         assert chat_response.headers["content-type"] == "text/event-stream; charset=utf-8"
 
-        # Parse SSE stream
-        events = parse_sse_stream(chat_response.text)
-        assert len(events) > 0
+        assert len(stream.events) > 0
 
-        # Verify event types
-        event_types = [e["event"] for e in events]
-        assert "metadata" in event_types
-        assert "content" in event_types
-        assert "state" in event_types
-        assert "done" in event_types
+        # Verify event types; metadata always comes first
+        assert {"metadata", "content", "state", "done"} <= stream.by_type.keys()
+        assert stream.events[0]["event"] == "metadata"
 
         # Extract conversation_id from metadata event
-        metadata_event = next(e for e in events if e["event"] == "metadata")
-        metadata_data = json.loads(metadata_event["data"])
+        metadata_event = stream.by_type["metadata"][0]
+        metadata_data = metadata_event["data"]
         conversation_id = metadata_data.get("conversation_id")
         assert conversation_id is not None
 
-        # Step 3: Retrieve conversation state
-        convo_response = await client.get(f"/conversations/{conversation_id}")
+        # Step 3: The stream's final state event reflects the chat context
+        state = stream.state
+        assert state["format"] == "Modern"
+        assert state["days"] == 30
+
+        # Retrieve the stored conversation, formats and archetypes concurrently
+        async with asyncio.TaskGroup() as tg:
+            convo_task = tg.create_task(client.get(f"/conversations/{conversation_id}"))
+            formats_task = tg.create_task(client.get("/formats"))
+            archetypes_task = tg.create_task(client.get("/archetypes?format=Modern"))
+        convo_response = convo_task.result()
+        formats_response = formats_task.result()
+        archetypes_response = archetypes_task.result()
+
+        # The first turn was persisted server-side with the same state the stream reported
         assert convo_response.status_code == 200
         convo_data = convo_response.json()
         assert convo_data["conversation_id"] == conversation_id
-        assert convo_data["state"]["format"] == "Modern"
-        assert convo_data["state"]["days"] == 30
+        assert convo_data["state"] == state
         assert len(convo_data["messages"]) >= 2  # User message + assistant response
 
-    async def test_conversation_continuation(self, client, load_test_data):
-        """Test continuing an existing conversation."""
-        # Start first conversation
-        chat1_response = await client.post(
-            "/chat",
-            json={
-                "message": "Show me Modern archetypes",
-                "conversation_id": None,
-                "context": {"format": "Modern", "days": 30},
-            },
-        )
-        assert chat1_response.status_code == 200
+        # Selected format should be one the API advertises
+        assert formats_response.status_code == 200
+        assert state["format"] in formats_response.json()["formats"]
 
-        # Extract conversation_id
-        events1 = parse_sse_stream(chat1_response.text)
-        metadata1 = next(e for e in events1 if e["event"] == "metadata")
-        conversation_id = json.loads(metadata1["data"])["conversation_id"]
+        # Archetypes are served for the selected format
+        assert archetypes_response.status_code == 200
+        assert archetypes_response.json()["format"] == state["format"]
+
+    @pytest.mark.integration_slow
+    async def test_conversation_continuation(self, client, modern_conversation, load_test_data):
+        """Test continuing an existing conversation."""
+        # Continue this test's own conversation from the modern_conversation fixture
+        _, stream1 = modern_conversation
+        metadata1 = stream1.by_type["metadata"][0]
+        conversation_id = metadata1["data"]["conversation_id"]
 
         # Continue conversation
-        chat2_response = await client.post(
-            "/chat",
-            json={
+        chat2_response, _ = await stream_chat(
+            client,
+            {
                 "message": "What about Pioneer?",
                 "conversation_id": conversation_id,
                 "context": {"format": "Pioneer", "days": 30},
@@ -127,6 +299,7 @@ class TestAgentAPIFullConversationFlow:
         convo_data = convo_response.json()
         assert len(convo_data["messages"]) >= 4  # 2 user + 2 assistant messages
 
+    @pytest.mark.integration_fast
     async def test_formats_endpoint(self, client, load_test_data):
         """Test GET /formats endpoint."""
         response = await client.get("/formats")
@@ -136,6 +309,7 @@ class TestAgentAPIFullConversationFlow:
         assert isinstance(data["formats"], list)
         assert len(data["formats"]) > 0
 
+    @pytest.mark.integration_fast
     async def test_archetypes_endpoint(self, client, load_test_data):
         """Test GET /archetypes endpoint."""
         response = await client.get("/archetypes?format=Modern")
@@ -148,329 +322,80 @@ class TestAgentAPIFullConversationFlow:
 
 
 @pytest.mark.integration
+@pytest.mark.integration_slow
+@pytest.mark.xdist_group(name="agent_api_workflow_interleaving")
 class TestAgentAPIWorkflowInterleaving:
     """E2E integration tests for workflow interleaving scenarios"""
 
-    @pytest.fixture
-    def base_url(self):
-        """Base URL for agent API. Defaults to port 8001 per README."""
-        return os.getenv("AGENT_API_BASE_URL", "http://localhost:8001")
-
-    @pytest.fixture
-    async def client(self, base_url):
-        """HTTP client for making requests."""
-        async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
-            yield client
-
-    async def test_meta_to_deck_coaching_transition(self, client, load_test_data):
-        """Test switching from meta research to deck coaching workflow."""
-        conversation_id = None
-
-        # Step 1: Start with meta research query
-        meta_response = await client.post(
-            "/chat",
-            json={
-                "message": "What's the Modern meta?",
-                "conversation_id": conversation_id,
-                "context": {"format": "Modern", "days": 30},
-            },
-        )
-        assert meta_response.status_code == 200
-
-        # Extract conversation_id
-        events = parse_sse_stream(meta_response.text)
-        metadata = next(e for e in events if e["event"] == "metadata")
-        conversation_id = json.loads(metadata["data"])["conversation_id"]
-
-        # Step 2: Switch to deck coaching with deck text
-        sample_deck = """4 Lightning Bolt
-4 Ragavan, Nimble Pilferer
-4 Dragon's Rage Channeler
-4 Murktide Regent
-4 Counterspell
-4 Consider
-4 Expressive Iteration
-2 Spell Pierce
-2 Unholy Heat
-2 Subtlety
-1 Brazen Borrower
-1 Jace, the Mind Sculptor
-4 Scalding Tarn
-4 Flooded Strand
-2 Steam Vents
-2 Volcanic Island
-1 Mountain
-1 Island
-4 Misty Rainforest
-4 Polluted Delta
-
-Sideboard:
-2 Engineered Explosives
-2 Relic of Progenitus
-2 Blood Moon
-2 Dress Down
-2 Subtlety
-2 Flusterstorm
-1 Brazen Borrower
-2 Surgical Extraction"""
-
-        deck_response = await client.post(
-            "/chat",
-            json={
-                "message": "How should I optimize this deck?",
-                "conversation_id": conversation_id,
-                "context": {
-                    "format": "Modern",
-                    "archetype": "Murktide",
-                    "deck_text": sample_deck,
-                },
-            },
-        )
-        assert deck_response.status_code == 200
-
-        # Verify conversation state includes deck
-        convo_response = await client.get(f"/conversations/{conversation_id}")
-        assert convo_response.status_code == 200
-        convo_data = convo_response.json()
-        assert convo_data["state"]["has_deck"] is True
-        assert convo_data["state"]["archetype"] == "Murktide"
-
-    async def test_deck_to_meta_transition(self, client, load_test_data):
-        """Test switching from deck coaching back to meta research."""
-        conversation_id = None
-
-        # Step 1: Start with deck coaching
-        sample_deck = """4 Lightning Bolt
-4 Ragavan, Nimble Pilferer
-4 Dragon's Rage Channeler
-4 Murktide Regent
-4 Counterspell
-4 Consider
-4 Expressive Iteration
-2 Spell Pierce
-2 Unholy Heat
-2 Subtlety
-1 Brazen Borrower
-1 Jace, the Mind Sculptor
-4 Scalding Tarn
-4 Flooded Strand
-2 Steam Vents
-2 Volcanic Island
-1 Mountain
-1 Island
-4 Misty Rainforest
-4 Polluted Delta
-
-Sideboard:
-2 Engineered Explosives
-2 Relic of Progenitus
-2 Blood Moon
-2 Dress Down
-2 Subtlety
-2 Flusterstorm
-1 Brazen Borrower
-2 Surgical Extraction"""
-
-        deck_response = await client.post(
-            "/chat",
-            json={
-                "message": "Analyze my deck",
-                "conversation_id": conversation_id,
-                "context": {
-                    "format": "Modern",
-                    "archetype": "Murktide",
-                    "deck_text": sample_deck,
-                },
-            },
-        )
-        assert deck_response.status_code == 200
-
-        # Extract conversation_id
-        events = parse_sse_stream(deck_response.text)
-        metadata = next(e for e in events if e["event"] == "metadata")
-        conversation_id = json.loads(metadata["data"])["conversation_id"]
-
-        # Step 2: Switch back to meta research
-        meta_response = await client.post(
-            "/chat",
-            json={
-                "message": "Now show me the Pioneer meta",
-                "conversation_id": conversation_id,
-                "context": {"format": "Pioneer", "days": 30},
-            },
-        )
-        assert meta_response.status_code == 200
-
-        # Verify conversation state preserved deck but switched format
-        convo_response = await client.get(f"/conversations/{conversation_id}")
-        assert convo_response.status_code == 200
-        convo_data = convo_response.json()
-        assert convo_data["state"]["format"] == "Pioneer"
-        # Deck should still be present
-        assert convo_data["state"]["has_deck"] is True
+    @pytest.mark.parametrize(
+        "first_turn,second_turn,expected_state",
+        [
+            pytest.param(
+                ("What's the Modern meta?", {"format": "Modern", "days": 30}),
+                ("How should I optimize this deck?", DECK_COACHING_CONTEXT),
+                {"has_deck": True, "archetype": "Murktide"},
+                id="meta_to_deck_coaching",
+            ),
+            pytest.param(
+                ("Analyze my deck", DECK_COACHING_CONTEXT),
+                ("Now show me the Pioneer meta", {"format": "Pioneer", "days": 30}),
+                # Deck should still be present after switching format
+                {"format": "Pioneer", "has_deck": True},
+                id="deck_to_meta",
+            ),
+        ],
+    )
+    async def test_workflow_transition(self, client, load_test_data, first_turn, second_turn, expected_state):
+        """Test switching between meta research and deck coaching in one conversation."""
+        conversation_id, _ = await chat_turn(client, None, *first_turn)
+        _, state = await chat_turn(client, conversation_id, *second_turn)
+
+        # Verify the state after the second turn reflects both turns
+        for key, value in expected_state.items():
+            assert state[key] == value, f"state[{key!r}]"
 
 
 @pytest.mark.integration
+@pytest.mark.integration_fast
+@pytest.mark.xdist_group(name="agent_api_blocking_dependencies")
 class TestAgentAPIBlockingDependencies:
     """E2E integration tests for blocking dependency enforcement"""
 
-    @pytest.fixture
-    def base_url(self):
-        """Base URL for agent API. Defaults to port 8001 per README."""
-        return os.getenv("AGENT_API_BASE_URL", "http://localhost:8001")
-
-    @pytest.fixture
-    async def client(self, base_url):
-        """HTTP client for making requests."""
-        async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
-            yield client
-
-    async def test_format_required_blocking(self, client, load_test_data):
-        """Test that format is required before proceeding."""
-        response = await client.post(
-            "/chat",
-            json={
-                "message": "What are the top decks?",
-                "conversation_id": None,
-                "context": {},  # No format provided
-            },
-        )
-        assert response.status_code == 200
-
-        # Parse SSE to get assistant response
-        events = parse_sse_stream(response.text)
-        content_events = [e for e in events if e["event"] == "content"]
-        assert len(content_events) > 0
-
-        # Check that response indicates format is required
-        content_data = json.loads(content_events[0]["data"])
-        assert "format" in content_data["text"].lower() or "required" in content_data["text"].lower()
-
-    async def test_days_required_for_meta_research(self, client, load_test_data):
-        """Test that days is required for meta research workflow."""
-        response = await client.post(
-            "/chat",
-            json={
-                "message": "Show me the Modern meta",
-                "conversation_id": None,
-                "context": {"format": "Modern"},  # No days provided
-            },
-        )
-        assert response.status_code == 200
-
-        # Parse SSE to get assistant response
-        events = parse_sse_stream(response.text)
-        content_events = [e for e in events if e["event"] == "content"]
-        assert len(content_events) > 0
-
-        # Check that response indicates days is required
-        content_data = json.loads(content_events[0]["data"])
-        assert "days" in content_data["text"].lower() or "required" in content_data["text"].lower()
-
-    async def test_deck_required_for_deck_coaching(self, client, load_test_data):
-        """Test that deck is required for deck coaching workflow."""
-        response = await client.post(
-            "/chat",
-            json={
-                "message": "Optimize my sideboard",
-                "conversation_id": None,
-                "context": {"format": "Modern", "archetype": "Murktide"},  # No deck_text
-            },
-        )
-        assert response.status_code == 200
-
-        # Parse SSE to get assistant response
-        events = parse_sse_stream(response.text)
-        content_events = [e for e in events if e["event"] == "content"]
-        assert len(content_events) > 0
-
-        # Check that response indicates deck is required
-        content_data = json.loads(content_events[0]["data"])
-        assert "deck" in content_data["text"].lower() or "required" in content_data["text"].lower()
+    async def test_blocking_dependencies(self, client, load_test_data):
+        """Test that each missing dependency blocks the workflow and asks for it.
 
-    async def test_deck_enrichment_required_for_deck_coaching(self, client, load_test_data):
-        """Test that deck enrichment (card_details) is required before deck coaching.
-        
-        When deck_text is provided but not enriched via get_enriched_deck,
-        the system should block and request deck enrichment first.
+        Every scenario starts its own conversation, so they run concurrently.
         """
-        sample_deck = """4 Lightning Bolt
-4 Ragavan, Nimble Pilferer
-4 Dragon's Rage Channeler
-4 Murktide Regent
-4 Counterspell
-4 Consider
-4 Expressive Iteration
-2 Spell Pierce
-2 Unholy Heat
-2 Subtlety
-1 Brazen Borrower
-1 Jace, the Mind Sculptor
-4 Scalding Tarn
-4 Flooded Strand
-2 Steam Vents
-2 Volcanic Island
-1 Mountain
-1 Island
-4 Misty Rainforest
-4 Polluted Delta
-
-Sideboard:
-2 Engineered Explosives
-2 Relic of Progenitus
-2 Blood Moon
-2 Dress Down
-2 Subtlety
-2 Flusterstorm
-1 Brazen Borrower
-2 Surgical Extraction"""
-
-        response = await client.post(
-            "/chat",
-            json={
-                "message": "Optimize my mainboard",
-                "conversation_id": None,
-                "context": {
-                    "format": "Modern",
-                    "deck_text": sample_deck,
-                    # No archetype provided, but more importantly, no card_details (enriched deck)
-                },
-            },
-        )
-        assert response.status_code == 200
+        results = await asyncio.gather(*(
+            first_chat_event(
+                client,
+                {"message": message, "conversation_id": None, "context": context},
+                "content",
+            )
+            for _, message, context, _, _ in BLOCKING_SCENARIOS
+        ))
 
-        # Parse SSE to get assistant response
-        events = parse_sse_stream(response.text)
-        content_events = [e for e in events if e["event"] == "content"]
-        assert len(content_events) > 0
+        for (scenario, _, _, match, terms), (response, first_content) in zip(BLOCKING_SCENARIOS, results):
+            assert response.status_code == 200, scenario
+            assert first_content is not None, scenario
 
-        # Check that response indicates deck enrichment is required
-        # The blocking message says "Please provide your deck list so I can enrich it first."
-        content_data = json.loads(content_events[0]["data"])
-        assert "deck" in content_data["text"].lower() and "enrich" in content_data["text"].lower()
+            # Check that the first response asks for the missing dependency
+            text_lower = first_content["data"]["text"].lower()
+            assert match(term in text_lower for term in terms), f"{scenario}: {text_lower!r}"
 
 
 @pytest.mark.integration
+@pytest.mark.integration_slow
+@pytest.mark.xdist_group(name="agent_api_llm_interpretation")
 class TestAgentAPILLMInterpretation:
     """E2E integration tests for LLM interpretation of tool results"""
 
-    @pytest.fixture
-    def base_url(self):
-        """Base URL for agent API. Defaults to port 8001 per README."""
-        return os.getenv("AGENT_API_BASE_URL", "http://localhost:8001")
-
-    @pytest.fixture
-    async def client(self, base_url):
-        """HTTP client for making requests."""
-        async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
-            yield client
-
     async def test_full_conversation_flow_with_llm_interpretation(self, client, load_test_data):
         """Test that full conversation flow returns LLM-interpreted natural language responses, not raw JSON."""
         # Step 1: Start conversation with meta research query
-        chat_response = await client.post(
-            "/chat",
-            json={
+        chat_response, stream = await stream_chat(
+            client,
+            {
                 "message": "What are the top decks in Modern?",
                 "conversation_id": None,
                 "context": {"format": "Modern", "days": 30},
@@ -479,22 +404,20 @@ class TestAgentAPILLMInterpretation:
         assert chat_response.status_code == 200
         assert chat_response.headers["content-type"] == "text/event-stream; charset=utf-8"
 
-        # Parse SSE stream
-        events = parse_sse_stream(chat_response.text)
-        assert len(events) > 0
+        assert len(stream.events) > 0
 
         # Extract conversation_id
-        metadata_event = next(e for e in events if e["event"] == "metadata")
-        metadata_data = json.loads(metadata_event["data"])
+        metadata_event = stream.by_type["metadata"][0]
+        metadata_data = metadata_event["data"]
         conversation_id = metadata_data.get("conversation_id")
         assert conversation_id is not None
 
         # Verify content events contain natural language (not raw JSON)
-        content_events = [e for e in events if e["event"] == "content"]
-        assert len(content_events) > 0
+        content_texts = [e["data"]["text"] for e in stream.by_type["content"]]
+        assert len(content_texts) > 0
         
         # Check that content is natural language (not raw JSON structure)
-        all_content = " ".join([json.loads(e["data"])["text"] for e in content_events])
+        all_content = " ".join(content_texts)
         
         # Natural language indicators (not raw JSON)
         assert not all_content.strip().startswith("{"), "Response should not start with JSON"
@@ -504,9 +427,9 @@ class TestAgentAPILLMInterpretation:
         
 
         # Step 2: Continue conversation - verify LLM interpretation continues
-        chat2_response = await client.post(
-            "/chat",
-            json={
+        chat2_response, stream2 = await stream_chat(
+            client,
+            {
                 "message": "Show me archetypes in Pioneer",
                 "conversation_id": conversation_id,
                 "context": {"format": "Pioneer", "days": 30},
@@ -514,11 +437,10 @@ class TestAgentAPILLMInterpretation:
         )
         assert chat2_response.status_code == 200
         
-        events2 = parse_sse_stream(chat2_response.text)
-        content_events2 = [e for e in events2 if e["event"] == "content"]
-        assert len(content_events2) > 0
+        content_texts2 = [e["data"]["text"] for e in stream2.by_type["content"]]
+        assert len(content_texts2) > 0
         
-        all_content2 = " ".join([json.loads(e["data"])["text"] for e in content_events2])
+        all_content2 = " ".join(content_texts2)
         assert not all_content2.strip().startswith("{"), "Second response should also be natural language"
         assert len(all_content2) > 30, "Second response should be substantial"
 
@@ -541,27 +463,13 @@ class TestAgentAPILLMInterpretation:
 
 
 @pytest.mark.integration
+@pytest.mark.integration_slow
+@pytest.mark.xdist_group(name="agent_api_welcome_session")
 class TestAgentAPIWelcomeSessionInitialization:
     """E2E integration tests for /welcome session initialization"""
 
-    @pytest.fixture
-    def base_url(self):
-        """Base URL for agent API. Defaults to port 8001 per README."""
-        return os.getenv("AGENT_API_BASE_URL", "http://localhost:8001")
-
-    @pytest.fixture
-    async def client(self, base_url):
-        """HTTP client for making requests."""
-        async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
-            yield client
-
-    async def test_welcome_creates_session_with_tool_catalog(self, client, load_test_data):
+    async def test_welcome_creates_session_with_tool_catalog(self, client, welcome_data, load_test_data):
         """Test that /welcome creates a new conversation session and stores tool_catalog."""
-        # Call /welcome
-        welcome_response = await client.get("/welcome")
-        assert welcome_response.status_code == 200
-        welcome_data = welcome_response.json()
-        
         # Verify response structure
         assert "conversation_id" in welcome_data
         assert "message" in welcome_data
@@ -598,12 +506,8 @@ class TestAgentAPIWelcomeSessionInitialization:
         # We verify it's stored by checking that /chat can use it (tested in next test)
         assert convo_data["conversation_id"] == conversation_id
 
-    async def test_welcome_message_is_llm_generated(self, client, load_test_data):
+    async def test_welcome_message_is_llm_generated(self, welcome_data, load_test_data):
         """Test that /welcome returns an LLM-generated welcome message, not static text."""
-        welcome_response = await client.get("/welcome")
-        assert welcome_response.status_code == 200
-        welcome_data = welcome_response.json()
-        
         welcome_message = welcome_data["message"]
         
         # Verify it's natural language (not static template)
@@ -618,20 +522,11 @@ class TestAgentAPIWelcomeSessionInitialization:
 
 
 @pytest.mark.integration
+@pytest.mark.integration_slow
+@pytest.mark.xdist_group(name="agent_api_chat_using_welcome")
 class TestAgentAPIChatUsingWelcomeInfo:
     """E2E integration tests for /chat using welcome info from session"""
 
-    @pytest.fixture
-    def base_url(self):
-        """Base URL for agent API. Defaults to port 8001 per README."""
-        return os.getenv("AGENT_API_BASE_URL", "http://localhost:8001")
-
-    @pytest.fixture
-    async def client(self, base_url):
-        """HTTP client for making requests."""
-        async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
-            yield client
-
     async def test_chat_uses_welcome_tool_catalog(self, client, load_test_data):
         """Test that /chat uses tool_catalog stored from /welcome session."""
         # Step 1: Call /welcome to create session with tool_catalog
@@ -641,9 +536,9 @@ class TestAgentAPIChatUsingWelcomeInfo:
         conversation_id = welcome_data["conversation_id"]
         
         # Step 2: Use conversation_id from welcome in /chat
-        chat_response = await client.post(
-            "/chat",
-            json={
+        chat_response, stream = await stream_chat(
+            client,
+            {
                 "message": "What tools do you have available?",
                 "conversation_id": conversation_id,
                 "context": {"format": "Modern", "days": 30},
@@ -651,20 +546,18 @@ class TestAgentAPIChatUsingWelcomeInfo:
         )
         assert chat_response.status_code == 200
         
-        # Parse SSE stream
-        events = parse_sse_stream(chat_response.text)
-        assert len(events) > 0
-        
+        assert len(stream.events) > 0
+
         # Verify metadata event includes tool_catalog info (indirectly via natural language response)
-        metadata_event = next(e for e in events if e["event"] == "metadata")
-        metadata_data = json.loads(metadata_event["data"])
+        metadata_event = stream.by_type["metadata"][0]
+        metadata_data = metadata_event["data"]
         assert metadata_data.get("conversation_id") == conversation_id
         
         # Verify content shows LLM has access to tool information
-        content_events = [e for e in events if e["event"] == "content"]
-        assert len(content_events) > 0
+        content_texts = [e["data"]["text"] for e in stream.by_type["content"]]
+        assert len(content_texts) > 0
         
-        all_content = " ".join([json.loads(e["data"])["text"] for e in content_events])
+        all_content = " ".join(content_texts)
         # LLM should be able to reference tools if it has tool_catalog from welcome
         # This is indirect verification - if tool_catalog wasn't available, LLM wouldn't know about tools
         assert len(all_content) > 30, "Response should reference capabilities"
@@ -678,9 +571,9 @@ class TestAgentAPIChatUsingWelcomeInfo:
         conversation_id = welcome_data["conversation_id"]
         
         # Step 2: Use conversation_id in chat
-        chat_response = await client.post(
-            "/chat",
-            json={
+        chat_response, stream = await stream_chat(
+            client,
+            {
                 "message": "What are the top decks in Modern?",
                 "conversation_id": conversation_id,
                 "context": {"format": "Modern", "days": 30},
@@ -689,24 +582,23 @@ class TestAgentAPIChatUsingWelcomeInfo:
         assert chat_response.status_code == 200
         
         # Verify conversation continues properly
-        events = parse_sse_stream(chat_response.text)
-        metadata_event = next(e for e in events if e["event"] == "metadata")
-        metadata_data = json.loads(metadata_event["data"])
+        metadata_event = stream.by_type["metadata"][0]
+        metadata_data = metadata_event["data"]
         assert metadata_data.get("conversation_id") == conversation_id
         
         # Verify response is natural language (LLM interpretation)
-        content_events = [e for e in events if e["event"] == "content"]
-        assert len(content_events) > 0
-        all_content = " ".join([json.loads(e["data"])["text"] for e in content_events])
+        content_texts = [e["data"]["text"] for e in stream.by_type["content"]]
+        assert len(content_texts) > 0
+        all_content = " ".join(content_texts)
         assert not all_content.strip().startswith("{"), "Response should be natural language"
         assert len(all_content) > 30, "Response should be substantial"
 
     async def test_chat_without_welcome_falls_back(self, client, load_test_data):
         """Test that /chat without prior /welcome still works (falls back to fetching tool_catalog)."""
         # Call /chat without prior /welcome
-        chat_response = await client.post(
-            "/chat",
-            json={
+        chat_response, stream = await stream_chat(
+            client,
+            {
                 "message": "What are the top decks in Modern?",
                 "conversation_id": None,
                 "context": {"format": "Modern", "days": 30},
@@ -715,15 +607,14 @@ class TestAgentAPIChatUsingWelcomeInfo:
         assert chat_response.status_code == 200
         
         # Should still work (tool_catalog fetched on demand)
-        events = parse_sse_stream(chat_response.text)
-        assert len(events) > 0
-        
-        metadata_event = next(e for e in events if e["event"] == "metadata")
-        metadata_data = json.loads(metadata_event["data"])
+        assert len(stream.events) > 0
+
+        metadata_event = stream.by_type["metadata"][0]
+        metadata_data = metadata_event["data"]
         conversation_id = metadata_data.get("conversation_id")
         assert conversation_id is not None
         
         # Verify response is natural language
-        content_events = [e for e in events if e["event"] == "content"]
+        content_events = stream.by_type["content"]
         assert len(content_events) > 0
 
@@ -12,10 +12,11 @@ from src.etl.archetype_pipeline import (
     ArchetypeClassificationResponse,
     StrategyType
 )
-from src.etl.cards_pipeline import CardsPipeline
 from src.etl.tournaments_pipeline import TournamentsPipeline
 from src.etl.database.connection import DatabaseConnection
 
+from tests.integration.helpers import scalar
+
 logger = logging.getLogger(__name__)
 
 
@@ -188,6 +189,7 @@ class TestLLMClientAzureOpenAI:
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group(name="etl_writes")
 class TestArchetypeClassificationPipeline:
     """Integration tests for archetype classification with real database"""
     
@@ -200,29 +202,10 @@ class TestArchetypeClassificationPipeline:
         )
     
     @pytest.fixture
-    def sample_tournament_data(self, test_database):
+    def sample_tournament_data(self, test_database, scryfall_cards_loaded):
         """Load sample tournament and card data into database"""
-        # Check if cards already exist (preserved across tests for performance)
-        with DatabaseConnection.get_cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM cards")
-            existing_card_count = cur.fetchone()[0]
-        
-        if existing_card_count > 0:
-            logger.info(f"Using existing {existing_card_count} cards in database (skipping Scryfall load)")
-        else:
-            # Load cards from Scryfall (only on first test)
-            logger.info("Loading card data from Scryfall...")
-            cards_pipeline = CardsPipeline()
-            cards_result = cards_pipeline.insert_cards(batch_size=1000, update_existing=True)
-            assert cards_result['cards_loaded'] > 0, "Failed to load any cards from Scryfall"
-            logger.info(f"Loaded {cards_result['cards_loaded']} cards")
-            
-            # Verify cards are in database
-            with DatabaseConnection.get_cursor() as cur:
-                cur.execute("SELECT COUNT(*) FROM cards")
-                card_count = cur.fetchone()[0]
-                assert card_count > 0, "Cards table is empty after loading"
-                logger.info(f"Verified {card_count} cards in database")
+        # Cards come from the shared session load, which runs under the test data lock
+        assert scryfall_cards_loaded['cards_loaded'] > 0, "Failed to load any cards from Scryfall"
         
         # Load a tournament
         api_key = os.getenv('TOPDECK_API_KEY')
@@ -246,26 +229,22 @@ class TestArchetypeClassificationPipeline:
         
         # Verify we have tournament in database
         with DatabaseConnection.get_cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM tournaments")
-            tournament_count = cur.fetchone()[0]
+            tournament_count = scalar(cur, "SELECT COUNT(*) FROM tournaments")
             assert tournament_count > 0, "Tournaments table is empty after insertion"
             
-            cur.execute("SELECT COUNT(*) FROM decklists")
-            decklist_count = cur.fetchone()[0]
+            decklist_count = scalar(cur, "SELECT COUNT(*) FROM decklists")
             assert decklist_count > 0, "Decklists table is empty after insertion"
             
-            cur.execute("SELECT COUNT(*) FROM deck_cards WHERE section = 'mainboard'")
-            deck_card_count = cur.fetchone()[0]
+            deck_card_count = scalar(cur, "SELECT COUNT(*) FROM deck_cards WHERE section = 'mainboard'")
             assert deck_card_count > 0, "No mainboard cards inserted"
             
             # Verify we have decklists with cards
-            cur.execute("""
+            decklists_with_cards = scalar(cur, """
                 SELECT COUNT(DISTINCT d.decklist_id)
                 FROM decklists d
                 JOIN deck_cards dc ON d.decklist_id = dc.decklist_id
                 WHERE dc.section = 'mainboard'
             """)
-            decklists_with_cards = cur.fetchone()[0]
             assert decklists_with_cards > 0, "No decklists have mainboard cards"
             logger.info(f"Loaded tournament with {decklist_count} decklists and {decklists_with_cards} with mainboard cards")
         
@@ -292,11 +271,10 @@ class TestArchetypeClassificationPipeline:
         
         # Verify these decklists actually have no archetype_group_id
         with DatabaseConnection.get_cursor() as cur:
-            cur.execute("""
+            unclassified_count = scalar(cur, """
                 SELECT COUNT(*) FROM decklists 
                 WHERE archetype_group_id IS NULL
             """)
-            unclassified_count = cur.fetchone()[0]
             assert unclassified_count == len(decklists), \
                 f"Mismatch between query result ({len(decklists)}) and actual NULL archetype_group_id count ({unclassified_count})"
         
@@ -368,10 +346,8 @@ class TestArchetypeClassificationPipeline:
         
         # Verify initial state - no archetype groups or classifications
         with DatabaseConnection.get_cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM archetype_groups")
-            initial_group_count = cur.fetchone()[0]
-            cur.execute("SELECT COUNT(*) FROM archetype_classifications")
-            initial_classification_count = cur.fetchone()[0]
+            initial_group_count = scalar(cur, "SELECT COUNT(*) FROM archetype_groups")
+            initial_classification_count = scalar(cur, "SELECT COUNT(*) FROM archetype_classifications")
         
         # Mock LLM response
         mock_response = {
@@ -428,13 +404,11 @@ class TestArchetypeClassificationPipeline:
             assert classification_result[6] is not None  # classified_at
             
             # Verify counts increased
-            cur.execute("SELECT COUNT(*) FROM archetype_groups")
-            final_group_count = cur.fetchone()[0]
+            final_group_count = scalar(cur, "SELECT COUNT(*) FROM archetype_groups")
             assert final_group_count == initial_group_count + 1, \
                 f"Expected group count to increase by 1 (from {initial_group_count} to {final_group_count})"
             
-            cur.execute("SELECT COUNT(*) FROM archetype_classifications")
-            final_classification_count = cur.fetchone()[0]
+            final_classification_count = scalar(cur, "SELECT COUNT(*) FROM archetype_classifications")
             assert final_classification_count == initial_classification_count + 1, \
                 f"Expected classification count to increase by 1 (from {initial_classification_count} to {final_classification_count})"
         
@@ -500,15 +474,12 @@ class TestArchetypeClassificationPipeline:
         """Test initial load with mocked LLM"""
         # Get initial counts
         with DatabaseConnection.get_cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM decklists")
-            total_decklists = cur.fetchone()[0]
+            total_decklists = scalar(cur, "SELECT COUNT(*) FROM decklists")
             assert total_decklists > 0, "No decklists in database to classify"
             
-            cur.execute("SELECT COUNT(*) FROM archetype_groups")
-            initial_group_count = cur.fetchone()[0]
+            initial_group_count = scalar(cur, "SELECT COUNT(*) FROM archetype_groups")
             
-            cur.execute("SELECT COUNT(*) FROM archetype_classifications")
-            initial_classification_count = cur.fetchone()[0]
+            initial_classification_count = scalar(cur, "SELECT COUNT(*) FROM archetype_classifications")
         
         # Mock LLM responses
         def mock_classify(cards, format_name, max_retries=1):
@@ -534,8 +505,7 @@ class TestArchetypeClassificationPipeline:
         
         # Verify archetype groups were created
         with DatabaseConnection.get_cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM archetype_groups")
-            archetype_group_count = cur.fetchone()[0]
+            archetype_group_count = scalar(cur, "SELECT COUNT(*) FROM archetype_groups")
             # Note: Could be less than objects_loaded if multiple decklists share same archetype
             assert archetype_group_count >= initial_group_count, \
                 f"Archetype groups did not increase (was {initial_group_count}, now {archetype_group_count})"
@@ -543,16 +513,14 @@ class TestArchetypeClassificationPipeline:
                 assert archetype_group_count >= 1, "No archetype groups created despite successful classifications"
             
             # Verify decklists reference archetype groups
-            cur.execute("""
+            linked_count = scalar(cur, """
                 SELECT COUNT(*) FROM decklists WHERE archetype_group_id IS NOT NULL
             """)
-            linked_count = cur.fetchone()[0]
             assert linked_count == result['objects_loaded'], \
                 f"Expected {result['objects_loaded']} decklists with archetype_group_id, got {linked_count}"
             
             # Verify classification events were created
-            cur.execute("SELECT COUNT(*) FROM archetype_classifications")
-            classification_count = cur.fetchone()[0]
+            classification_count = scalar(cur, "SELECT COUNT(*) FROM archetype_classifications")
             assert classification_count == initial_classification_count + result['objects_loaded'], \
                 f"Expected {result['objects_loaded']} new classifications, got {classification_count - initial_classification_count}"
         
@@ -596,8 +564,7 @@ class TestArchetypeClassificationPipeline:
             
             # Get counts after initial load
             with DatabaseConnection.get_cursor() as cur:
-                cur.execute("SELECT COUNT(*) FROM archetype_classifications")
-                classifications_after_initial = cur.fetchone()[0]
+                classifications_after_initial = scalar(cur, "SELECT COUNT(*) FROM archetype_classifications")
                 assert classifications_after_initial == initial_result['objects_loaded'], \
                     f"Classification count mismatch after initial load"
             
@@ -610,24 +577,21 @@ class TestArchetypeClassificationPipeline:
         
         # Verify total classification events
         with DatabaseConnection.get_cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM archetype_classifications")
-            classification_count = cur.fetchone()[0]
+            classification_count = scalar(cur, "SELECT COUNT(*) FROM archetype_classifications")
             assert classification_count == total_classified, \
                 f"Expected {total_classified} total classifications, got {classification_count}"
             
             # Verify archetype groups (may be fewer if decklists share archetypes)
-            cur.execute("SELECT COUNT(*) FROM archetype_groups")
-            archetype_group_count = cur.fetchone()[0]
+            archetype_group_count = scalar(cur, "SELECT COUNT(*) FROM archetype_groups")
             if total_classified > 0:
                 assert archetype_group_count >= 1, "No archetype groups created"
             
             # Verify load metadata for incremental load
             if incremental_result['objects_loaded'] > 0:
-                cur.execute("""
+                incremental_metadata_count = scalar(cur, """
                     SELECT COUNT(*) FROM load_metadata 
                     WHERE data_type = 'archetypes' AND load_type = 'incremental'
                 """)
-                incremental_metadata_count = cur.fetchone()[0]
                 assert incremental_metadata_count >= 1, "No incremental load metadata created"
         
         logger.info(
@@ -4,18 +4,22 @@ import os
 import pytest
 import logging
 from datetime import datetime, timedelta, timezone
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
 
 from src.app.mcp.tools import meta_research_tools, deck_coaching_tools
 from src.etl.database.connection import DatabaseConnection
+from tests.integration.helpers import SAMPLE_MURKTIDE_DECK
 
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(scope="module")
+def enriched_sample_deck(load_test_data):
+    """Enrich SAMPLE_MURKTIDE_DECK once for the module; the coaching tools only read it."""
+    enriched = deck_coaching_tools.get_enriched_deck.fn(deck=SAMPLE_MURKTIDE_DECK)
+    assert len(enriched["card_details"]) > 0
+    return enriched
+
+
 def get_archetype_for_format(format_name: str) -> str:
     """Helper to get an archetype name for a given format from the test database."""
     with DatabaseConnection.get_cursor() as cur:
@@ -153,43 +157,9 @@ class TestMCPMetaResearchTools:
 class TestMCPDeckCoachingTools:
     """E2E integration tests for MCP deck coaching tools with real data"""
     
-    @pytest.fixture
-    def sample_deck(self):
-        """Sample Modern deck for testing"""
-        return """4 Lightning Bolt
-4 Ragavan, Nimble Pilferer
-4 Dragon's Rage Channeler
-4 Murktide Regent
-4 Counterspell
-4 Consider
-4 Expressive Iteration
-2 Spell Pierce
-2 Unholy Heat
-2 Subtlety
-1 Brazen Borrower
-1 Jace, the Mind Sculptor
-4 Scalding Tarn
-4 Flooded Strand
-2 Steam Vents
-2 Volcanic Island
-1 Mountain
-1 Island
-4 Misty Rainforest
-4 Polluted Delta
-
-Sideboard:
-2 Engineered Explosives
-2 Relic of Progenitus
-2 Blood Moon
-2 Dress Down
-2 Subtlety
-2 Flusterstorm
-1 Brazen Borrower
-2 Surgical Extraction"""
-    
-    def test_get_enriched_deck(self, load_test_data, sample_deck):
+    def test_get_enriched_deck(self, enriched_sample_deck):
         """Test get_enriched_deck with real card data"""
-        result = deck_coaching_tools.get_enriched_deck.fn(deck=sample_deck)
+        result = enriched_sample_deck
         
         # Verify structure
         assert "card_details" in result
@@ -267,12 +237,10 @@ Sideboard:
         assert result["format"] == format_name
         assert result["matchup_stats"] == []
     
-    def test_generate_deck_matchup_strategy(self, load_test_data, sample_deck):
+    def test_generate_deck_matchup_strategy(self, load_test_data, enriched_sample_deck):
         """Test generate_deck_matchup_strategy with real LLM"""
-        # Get enriched deck
-        enriched = deck_coaching_tools.get_enriched_deck.fn(deck=sample_deck)
-        assert len(enriched["card_details"]) > 0
-        
+        enriched = enriched_sample_deck
+
         # Get a real opponent archetype (fixture ensures data exists)
         opponent_archetype = get_archetype_for_format("Modern")
         
@@ -298,12 +266,10 @@ Sideboard:
         elif "error" in result:
             logger.warning(f"LLM error: {result['error']}")
     
-    def test_optimize_mainboard(self, load_test_data, sample_deck):
+    def test_optimize_mainboard(self, load_test_data, enriched_sample_deck):
         """Test optimize_mainboard with real data and LLM"""
-        # Get enriched deck
-        enriched = deck_coaching_tools.get_enriched_deck.fn(deck=sample_deck)
-        assert len(enriched["card_details"]) > 0
-        
+        enriched = enriched_sample_deck
+
         result = deck_coaching_tools.optimize_mainboard.fn(
             card_details=enriched["card_details"],
             archetype="Murktide",
@@ -324,12 +290,10 @@ Sideboard:
         elif "error" in result:
             logger.warning(f"Optimization error: {result['error']}")
     
-    def test_optimize_sideboard(self, load_test_data, sample_deck):
+    def test_optimize_sideboard(self, load_test_data, enriched_sample_deck):
         """Test optimize_sideboard with real data and LLM"""
-        # Get enriched deck
-        enriched = deck_coaching_tools.get_enriched_deck.fn(deck=sample_deck)
-        assert len(enriched["card_details"]) > 0
-        
+        enriched = enriched_sample_deck
+
         result = deck_coaching_tools.optimize_sideboard.fn(
             card_details=enriched["card_details"],
             archetype="Murktide",
@@ -408,39 +372,8 @@ class TestMCPToolsIntegration:
     
     def test_full_workflow_deck_coaching(self, load_test_data):
         """Test full workflow: enrich deck -> get matchup stats -> generate strategy"""
-        sample_deck = """4 Lightning Bolt
-4 Ragavan, Nimble Pilferer
-4 Dragon's Rage Channeler
-4 Murktide Regent
-4 Counterspell
-4 Consider
-4 Expressive Iteration
-2 Spell Pierce
-2 Unholy Heat
-2 Subtlety
-1 Brazen Borrower
-1 Jace, the Mind Sculptor
-4 Scalding Tarn
-4 Flooded Strand
-2 Steam Vents
-2 Volcanic Island
-1 Mountain
-1 Island
-4 Misty Rainforest
-4 Polluted Delta
-
-Sideboard:
-2 Engineered Explosives
-2 Relic of Progenitus
-2 Blood Moon
-2 Dress Down
-2 Subtlety
-2 Flusterstorm
-1 Brazen Borrower
-2 Surgical Extraction"""
-        
         # Step 1: Enrich deck
-        enriched = deck_coaching_tools.get_enriched_deck.fn(deck=sample_deck)
+        enriched = deck_coaching_tools.get_enriched_deck.fn(deck=SAMPLE_MURKTIDE_DECK)
         assert len(enriched["card_details"]) > 0
         
         # Step 2: Get matchup stats
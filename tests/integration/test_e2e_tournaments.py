@@ -9,6 +9,8 @@ from src.clients.topdeck_client import TopDeckClient
 from src.etl.tournaments_pipeline import TournamentsPipeline
 from src.etl.database.connection import DatabaseConnection
 
+from tests.integration.helpers import scalar
+
 logger = logging.getLogger(__name__)
 
 
@@ -98,12 +100,13 @@ class TestTopDeckClient:
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group(name="etl_writes")
 class TestTournamentsPipeline:
     """Integration tests for TournamentsPipeline with real database"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def pipeline(self):
-        """Create TournamentsPipeline instance"""
+        """Create TournamentsPipeline instance shared by the class (reuses its TopDeck HTTP session)"""
         api_key = os.getenv('TOPDECK_API_KEY')
         assert api_key, "TOPDECK_API_KEY environment variable not set"
         return TournamentsPipeline(api_key)
@@ -147,16 +150,15 @@ class TestTournamentsPipeline:
         
         logger.info(f"Filtered {len(tournaments)} tournaments to {len(filtered)} constructed tournaments")
     
-    def test_insert_tournament(self, pipeline, sample_tournament, test_database):
+    def test_insert_tournament(self, pipeline, sample_tournament, db_savepoint):
         """Test inserting a tournament into database"""
         tournament_id = sample_tournament.get('TID')
         assert tournament_id is not None
         
-        with DatabaseConnection.transaction() as conn:
-            pipeline.insert_tournament(sample_tournament, conn)
+        pipeline.insert_tournament(sample_tournament, db_savepoint)
         
-        # Verify tournament is in database
-        with DatabaseConnection.get_cursor() as cur:
+        # Verify tournament is visible on the same (uncommitted) connection
+        with db_savepoint.cursor() as cur:
             cur.execute(
                 "SELECT tournament_id, tournament_name, format FROM tournaments WHERE tournament_id = %s",
                 (tournament_id,)
@@ -176,41 +178,31 @@ class TestTournamentsPipeline:
         success = pipeline.insert_all(sample_tournament, include_rounds=True)
         assert success is True
         
-        # Verify tournament is in database
+        # Verify tournament and its players, decklists, rounds, and matches in one round-trip
         with DatabaseConnection.get_cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM tournaments WHERE tournament_id = %s", (tournament_id,))
-            tournament_count = cur.fetchone()[0]
-            assert tournament_count == 1
-            
-            # Check players
-            cur.execute("SELECT COUNT(*) FROM players WHERE tournament_id = %s", (tournament_id,))
-            player_count = cur.fetchone()[0]
-            
-            # Check decklists
-            cur.execute("SELECT COUNT(*) FROM decklists WHERE tournament_id = %s", (tournament_id,))
-            decklist_count = cur.fetchone()[0]
-            
-            # Check rounds
-            cur.execute("SELECT COUNT(*) FROM match_rounds WHERE tournament_id = %s", (tournament_id,))
-            rounds_count = cur.fetchone()[0]
-            
-            # Check matches
-            cur.execute("SELECT COUNT(*) FROM matches WHERE tournament_id = %s", (tournament_id,))
-            matches_count = cur.fetchone()[0]
+            cur.execute(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM tournaments WHERE tournament_id = %(tid)s),
+                    (SELECT COUNT(*) FROM players WHERE tournament_id = %(tid)s),
+                    (SELECT COUNT(*) FROM decklists WHERE tournament_id = %(tid)s),
+                    (SELECT COUNT(*) FROM match_rounds WHERE tournament_id = %(tid)s),
+                    (SELECT COUNT(*) FROM matches WHERE tournament_id = %(tid)s)
+                """,
+                {'tid': tournament_id}
+            )
+            tournament_count, player_count, decklist_count, rounds_count, matches_count = cur.fetchone()
+        
+        assert tournament_count == 1
         
         logger.info(
             f"Tournament {tournament_id}: {player_count} players, {decklist_count} decklists, "
             f"{rounds_count} rounds, {matches_count} matches"
         )
     
-    def test_insert_all_with_deck_cards(self, pipeline, sample_tournament, test_database):
+    def test_insert_all_with_deck_cards(self, pipeline, sample_tournament, scryfall_cards_loaded):
         """Test inserting tournament with deck cards (requires cards table to be populated)"""
-        # First, load some cards into the database
-        from src.etl.cards_pipeline import CardsPipeline
-        cards_pipeline = CardsPipeline()
-        cards_result = cards_pipeline.insert_cards(batch_size=1000, update_existing=True)
-        
-        assert cards_result['cards_loaded'] > 0
+        assert scryfall_cards_loaded['cards_loaded'] > 0
         
         tournament_id = sample_tournament.get('TID')
         assert tournament_id is not None
@@ -230,11 +222,10 @@ class TestTournamentsPipeline:
             
             if decklist_ids:
                 # Check deck_cards
-                cur.execute(
+                deck_cards_count = scalar(cur,
                     "SELECT COUNT(*) FROM deck_cards WHERE decklist_id = ANY(%s)",
                     (decklist_ids,)
                 )
-                deck_cards_count = cur.fetchone()[0]
                 
                 logger.info(
                     f"Tournament {tournament_id}: {len(decklist_ids)} decklists, "
@@ -251,24 +242,21 @@ class TestTournamentsPipeline:
         assert result['objects_processed'] >= 0
         assert result['errors'] == 0
         
-        # Verify tournaments are in database
+        # Verify tournaments and related tables in one round-trip
         with DatabaseConnection.get_cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM tournaments")
-            tournament_count = cur.fetchone()[0]
-            assert tournament_count == result['objects_loaded']
-            
-            # Check related tables
-            cur.execute("SELECT COUNT(*) FROM players")
-            player_count = cur.fetchone()[0]
-            
-            cur.execute("SELECT COUNT(*) FROM decklists")
-            decklist_count = cur.fetchone()[0]
-            
-            cur.execute("SELECT COUNT(*) FROM match_rounds")
-            rounds_count = cur.fetchone()[0]
-            
-            cur.execute("SELECT COUNT(*) FROM matches")
-            matches_count = cur.fetchone()[0]
+            cur.execute(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM tournaments),
+                    (SELECT COUNT(*) FROM players),
+                    (SELECT COUNT(*) FROM decklists),
+                    (SELECT COUNT(*) FROM match_rounds),
+                    (SELECT COUNT(*) FROM matches)
+                """
+            )
+            tournament_count, player_count, decklist_count, rounds_count, matches_count = cur.fetchone()
+        
+        assert tournament_count == result['objects_loaded']
         
         # Verify load metadata
         with DatabaseConnection.get_cursor() as cur:
@@ -303,8 +291,7 @@ class TestTournamentsPipeline:
         
         # Verify total count
         with DatabaseConnection.get_cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM tournaments")
-            final_count = cur.fetchone()[0]
+            final_count = scalar(cur, "SELECT COUNT(*) FROM tournaments")
         
         # Final count should be initial + incremental (or same if no new tournaments)
         assert final_count >= initial_count
@@ -340,18 +327,17 @@ class TestTournamentsPipeline:
             assert tournament[3] is not None  # start_date
             
             # Check players have required fields
-            cur.execute(
+            null_players = scalar(cur,
                 """
                 SELECT COUNT(*) FROM players 
                 WHERE tournament_id = %s AND (player_id IS NULL OR name IS NULL OR name = '')
                 """,
                 (tournament_id,)
             )
-            null_players = cur.fetchone()[0]
             assert null_players == 0
             
             # Check decklists reference valid players
-            cur.execute(
+            orphaned_decklists = scalar(cur,
                 """
                 SELECT COUNT(*) FROM decklists d
                 WHERE d.tournament_id = %s
@@ -362,11 +348,10 @@ class TestTournamentsPipeline:
                 """,
                 (tournament_id,)
             )
-            orphaned_decklists = cur.fetchone()[0]
             assert orphaned_decklists == 0
             
             # Check matches reference valid players
-            cur.execute(
+            invalid_matches = scalar(cur,
                 """
                 SELECT COUNT(*) FROM matches m
                 WHERE m.tournament_id = %s
@@ -377,7 +362,6 @@ class TestTournamentsPipeline:
                 """,
                 (tournament_id,)
             )
-            invalid_matches = cur.fetchone()[0]
             assert invalid_matches == 0
         
         logger.info("Tournament data integrity checks passed")
@@ -395,39 +379,28 @@ class TestTournamentsPipeline:
         assert result['objects_loaded'] > 0
         
         with DatabaseConnection.get_cursor() as cur:
-            # Get counts for all tables
-            cur.execute("SELECT COUNT(*) FROM tournaments")
-            tournaments_count = cur.fetchone()[0]
-            
-            cur.execute("SELECT COUNT(*) FROM players")
-            players_count = cur.fetchone()[0]
-            
-            cur.execute("SELECT COUNT(*) FROM decklists")
-            decklists_count = cur.fetchone()[0]
-            
-            cur.execute("SELECT COUNT(*) FROM deck_cards")
-            deck_cards_count = cur.fetchone()[0]
-            
-            cur.execute("SELECT COUNT(*) FROM match_rounds")
-            rounds_count = cur.fetchone()[0]
-            
-            cur.execute("SELECT COUNT(*) FROM matches")
-            matches_count = cur.fetchone()[0]
-            
-            # Verify relationships
-            # Each tournament should have at least some players (if tournament has players)
+            # Get counts for all tables in a single round-trip
             cur.execute(
                 """
-                SELECT COUNT(DISTINCT tournament_id) FROM players
+                SELECT
+                    (SELECT COUNT(*) FROM tournaments),
+                    (SELECT COUNT(*) FROM players),
+                    (SELECT COUNT(*) FROM decklists),
+                    (SELECT COUNT(*) FROM deck_cards),
+                    (SELECT COUNT(*) FROM match_rounds),
+                    (SELECT COUNT(*) FROM matches)
                 """
             )
-            tournaments_with_players = cur.fetchone()[0]
+            (
+                tournaments_count, players_count, decklists_count,
+                deck_cards_count, rounds_count, matches_count
+            ) = cur.fetchone()
             
             # Decklists should not exceed players
             assert decklists_count <= players_count
             
             # Matches should reference valid rounds
-            cur.execute(
+            orphaned_matches = scalar(cur,
                 """
                 SELECT COUNT(*) FROM matches m
                 WHERE NOT EXISTS (
@@ -437,7 +410,6 @@ class TestTournamentsPipeline:
                 )
                 """
             )
-            orphaned_matches = cur.fetchone()[0]
             assert orphaned_matches == 0
         
         logger.info(
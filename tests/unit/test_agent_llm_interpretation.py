@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.app.agent_api.prompts import generate_agent_response, generate_welcome_message
 from src.app.agent_api.state import create_initial_state
 
 
@@ -12,8 +13,6 @@ class TestGenerateAgentResponse:
 
     @patch("src.app.agent_api.prompts.get_llm_client")
     def test_generate_response_with_tool_results(self, mock_get_client):
-        from src.app.agent_api.prompts import generate_agent_response
-        
         mock_client = MagicMock()
         mock_client.run.return_value.text = "Based on the Modern meta, Boros Energy leads with 12.3% share."
         mock_get_client.return_value = mock_client
@@ -43,8 +42,6 @@ class TestGenerateAgentResponse:
 
     @patch("src.app.agent_api.prompts.get_llm_client")
     def test_generate_response_without_tool_results(self, mock_get_client):
-        from src.app.agent_api.prompts import generate_agent_response
-        
         mock_client = MagicMock()
         mock_client.run.return_value.text = "I'd be happy to help! What format are you interested in?"
         mock_get_client.return_value = mock_client
@@ -61,8 +58,6 @@ class TestGenerateAgentResponse:
 
     @patch("src.app.agent_api.prompts.get_llm_client")
     def test_generate_response_uses_conversation_context(self, mock_get_client):
-        from src.app.agent_api.prompts import generate_agent_response
-        
         mock_client = MagicMock()
         mock_client.run.return_value.text = "Your Burn deck has good matchups against control."
         mock_get_client.return_value = mock_client
@@ -84,8 +79,6 @@ class TestGenerateAgentResponse:
 
     @patch("src.app.agent_api.prompts.get_llm_client")
     def test_generate_response_includes_conversation_history(self, mock_get_client):
-        from src.app.agent_api.prompts import generate_agent_response
-        
         mock_client = MagicMock()
         mock_client.run.return_value.text = "Here are the top decks you asked about."
         mock_get_client.return_value = mock_client
@@ -109,8 +102,6 @@ class TestGenerateAgentResponse:
 
     @patch("src.app.agent_api.prompts.get_llm_client")
     def test_generate_response_includes_tool_catalog(self, mock_get_client):
-        from src.app.agent_api.prompts import generate_agent_response
-        
         mock_client = MagicMock()
         mock_client.run.return_value.text = "Here are the results. You can also use optimize_sideboard."
         mock_get_client.return_value = mock_client
@@ -134,8 +125,6 @@ class TestGenerateAgentResponse:
 
     @patch("src.app.agent_api.prompts.get_llm_client")
     def test_generate_response_with_multiple_tool_results(self, mock_get_client):
-        from src.app.agent_api.prompts import generate_agent_response
-        
         mock_client = MagicMock()
         mock_client.run.return_value.text = "The meta is led by Boros Energy, and your Burn deck has a 45% matchup against them."
         mock_get_client.return_value = mock_client
@@ -172,8 +161,6 @@ class TestLLMGenerateWelcomeMessage:
 
     @patch("src.app.agent_api.prompts.get_llm_client")
     def test_generate_welcome_message_returns_natural_language(self, mock_get_client):
-        from src.app.agent_api.prompts import generate_welcome_message
-        
         mock_client = MagicMock()
         mock_client.run.return_value.text = "Welcome to MTG Meta Mage! I can help you analyze the meta and coach your deck."
         mock_get_client.return_value = mock_client
@@ -200,8 +187,6 @@ class TestLLMGenerateWelcomeMessage:
 
     @patch("src.app.agent_api.prompts.get_llm_client")
     def test_generate_welcome_message_includes_formats(self, mock_get_client):
-        from src.app.agent_api.prompts import generate_welcome_message
-        
         mock_client = MagicMock()
         mock_client.run.return_value.text = "Welcome! I support Modern, Pioneer, and Legacy."
         mock_get_client.return_value = mock_client
@@ -221,8 +206,6 @@ class TestLLMGenerateWelcomeMessage:
 
     @patch("src.app.agent_api.prompts.get_llm_client")
     def test_generate_welcome_message_includes_workflow_descriptions(self, mock_get_client):
-        from src.app.agent_api.prompts import generate_welcome_message
-        
         mock_client = MagicMock()
         mock_client.run.return_value.text = "I can help with meta research and deck coaching."
         mock_get_client.return_value = mock_client
@@ -244,8 +227,6 @@ class TestLLMGenerateWelcomeMessage:
 
     @patch("src.app.agent_api.prompts.get_llm_client")
     def test_generate_welcome_message_handles_llm_error_gracefully(self, mock_get_client):
-        from src.app.agent_api.prompts import generate_welcome_message
-        
         mock_get_client.side_effect = RuntimeError("LLM unavailable")
         
         # Should return a fallback message, not raise
@@ -1,18 +1,37 @@
 """Tests for Agent API FastAPI routes."""
 
-import json
-import re
+import orjson
+import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import MagicMock, patch
 
 from src.app.agent_api.main import app, conversation_store
 
-client = TestClient(app)
+
+@pytest.fixture(scope="module")
+def client():
+    """TestClient shared by the module; the context manager runs app startup and shutdown once."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def extract_conversation_id(lines):
+    """Return the conversation_id from the first metadata event in SSE lines, or None.
+
+    Stops reading at the metadata event's data line, which the server always sends first.
+    """
+    in_metadata = False
+    for line in lines:
+        if line.startswith("event:"):
+            in_metadata = line == "event: metadata"
+        elif in_metadata and line.startswith("data:"):
+            return orjson.loads(line[len("data:"):]).get("conversation_id")
+    return None
 
 
 @patch("src.app.agent_api.routes.get_tool_catalog_safe")
 @patch("src.app.agent_api.routes.DatabaseConnection.get_cursor")
-def test_get_welcome_returns_discovery_info(mock_get_cursor, mock_get_tool_catalog):
+def test_get_welcome_returns_discovery_info(mock_get_cursor, mock_get_tool_catalog, client):
     cursor = MagicMock()
     cursor.fetchall.return_value = [("Modern",), ("Pioneer",), ("Legacy",)]
     cursor.description = [("format",)]
@@ -38,8 +57,9 @@ def test_get_welcome_returns_discovery_info(mock_get_cursor, mock_get_tool_catal
     
     # Check workflows
     assert len(payload["workflows"]) == 2
-    meta_workflow = next(w for w in payload["workflows"] if w["name"] == "meta_research")
-    deck_workflow = next(w for w in payload["workflows"] if w["name"] == "deck_coaching")
+    workflows_by_name = {w["name"]: w for w in payload["workflows"]}
+    meta_workflow = workflows_by_name["meta_research"]
+    deck_workflow = workflows_by_name["deck_coaching"]
     
     # Check meta workflow
     assert "description" in meta_workflow
@@ -59,7 +79,7 @@ def test_get_welcome_returns_discovery_info(mock_get_cursor, mock_get_tool_catal
 
 @patch("src.app.agent_api.routes.get_tool_catalog_safe")
 @patch("src.app.agent_api.routes.DatabaseConnection.get_cursor")
-def test_get_welcome_fails_loudly_on_empty_tool_catalog(mock_get_cursor, mock_get_tool_catalog):
+def test_get_welcome_fails_loudly_on_empty_tool_catalog(mock_get_cursor, mock_get_tool_catalog, client):
     """Test that /welcome returns 503 when MCP tool discovery returns empty catalog."""
     cursor = MagicMock()
     cursor.fetchall.return_value = [("Modern",), ("Pioneer",)]
@@ -76,7 +96,7 @@ def test_get_welcome_fails_loudly_on_empty_tool_catalog(mock_get_cursor, mock_ge
 
 
 @patch("src.app.agent_api.routes.DatabaseConnection.get_cursor")
-def test_get_formats_returns_sorted_list(mock_get_cursor):
+def test_get_formats_returns_sorted_list(mock_get_cursor, client):
     cursor = MagicMock()
     cursor.fetchall.return_value = [("Pioneer",), ("Modern",), ("Legacy",)]
     cursor.description = [("format",)]
@@ -88,7 +108,7 @@ def test_get_formats_returns_sorted_list(mock_get_cursor):
 
 
 @patch("src.app.agent_api.routes.get_format_archetypes")
-def test_get_archetypes_returns_data(mock_tool):
+def test_get_archetypes_returns_data(mock_tool, client):
     mock_tool.fn.return_value = {
         "format": "Modern",
         "archetypes": [{"id": 1, "name": "Deck A", "meta_share": 10.0, "color_identity": "UR"}],
@@ -100,12 +120,12 @@ def test_get_archetypes_returns_data(mock_tool):
     assert payload["archetypes"][0]["name"] == "Deck A"
 
 
-def test_get_archetypes_missing_format_returns_400():
+def test_get_archetypes_missing_format_returns_400(client):
     response = client.get("/archetypes")
     assert response.status_code == 400
 
 
-def test_get_and_missing_conversation():
+def test_get_and_missing_conversation(client):
     convo = conversation_store.create()
     cid = convo["conversation_id"]
 
@@ -117,7 +137,7 @@ def test_get_and_missing_conversation():
     assert response_missing.status_code == 404
 
 
-def test_chat_endpoint_streams_sse():
+def test_chat_endpoint_streams_sse(client):
     payload = {
         "message": "What's the Modern meta?",
         "conversation_id": None,
@@ -127,19 +147,21 @@ def test_chat_endpoint_streams_sse():
     response = client.post("/chat", json=payload)
     assert response.status_code == 200
     assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["x-accel-buffering"] == "no"
     body = response.text
-    assert "event: metadata" in body
+    assert body.startswith("event: metadata")
     assert "event: done" in body
 
 
-def test_chat_endpoint_validates_message():
+def test_chat_endpoint_validates_message(client):
     payload = {"message": "   ", "conversation_id": None, "context": {}}
     response = client.post("/chat", json=payload)
     assert response.status_code == 400
 
 
 @patch("src.app.agent_api.routes.get_tool_catalog_safe")
-def test_chat_endpoint_stores_tool_catalog_in_state(mock_get_tool_catalog):
+def test_chat_endpoint_stores_tool_catalog_in_state(mock_get_tool_catalog, client):
     """Test that tool_catalog is stored in conversation state during /chat initialization."""
     mock_tool_catalog = [
         {"name": "get_format_meta_rankings", "description": "Get format-wide meta rankings", "server": "mtg-meta-mage-mcp"},
@@ -153,21 +175,10 @@ def test_chat_endpoint_stores_tool_catalog_in_state(mock_get_tool_catalog):
         "context": {"format": "Modern", "days": 30},
     }
     
-    response = client.post("/chat", json=payload)
-    assert response.status_code == 200
-    
-    # Parse SSE stream to extract conversation_id from metadata event
-    body = response.text
-    lines = body.split('\n')
-    conversation_id = None
-    for i, line in enumerate(lines):
-        if line == "event: metadata" and i + 1 < len(lines):
-            data_line = lines[i + 1]
-            if data_line.startswith("data: "):
-                data_json = data_line[6:]  # Remove "data: " prefix
-                metadata = json.loads(data_json)
-                conversation_id = metadata.get("conversation_id")
-                break
+    with client.stream("POST", "/chat", json=payload) as response:
+        assert response.status_code == 200
+        # Read only up to the metadata event, which carries the conversation_id
+        conversation_id = extract_conversation_id(response.iter_lines())
     
     # Verify conversation_id was extracted
     assert conversation_id is not None, "Failed to extract conversation_id from SSE stream"
@@ -182,7 +193,7 @@ def test_chat_endpoint_stores_tool_catalog_in_state(mock_get_tool_catalog):
 @patch("src.app.agent_api.routes.generate_welcome_message")
 @patch("src.app.agent_api.routes.get_tool_catalog_safe")
 @patch("src.app.agent_api.routes.DatabaseConnection.get_cursor")
-def test_welcome_creates_session_and_returns_conversation_id(mock_get_cursor, mock_get_tool_catalog, mock_generate_welcome):
+def test_welcome_creates_session_and_returns_conversation_id(mock_get_cursor, mock_get_tool_catalog, mock_generate_welcome, client):
     """Test that /welcome creates a new conversation and returns conversation_id."""
     cursor = MagicMock()
     cursor.fetchall.return_value = [("Modern",), ("Pioneer",)]
@@ -210,7 +221,7 @@ def test_welcome_creates_session_and_returns_conversation_id(mock_get_cursor, mo
 @patch("src.app.agent_api.routes.generate_welcome_message")
 @patch("src.app.agent_api.routes.get_tool_catalog_safe")
 @patch("src.app.agent_api.routes.DatabaseConnection.get_cursor")
-def test_welcome_generates_llm_interpreted_message(mock_get_cursor, mock_get_tool_catalog, mock_generate_welcome):
+def test_welcome_generates_llm_interpreted_message(mock_get_cursor, mock_get_tool_catalog, mock_generate_welcome, client):
     """Test that /welcome returns an LLM-generated welcome message."""
     cursor = MagicMock()
     cursor.fetchall.return_value = [("Modern",), ("Pioneer",)]
@@ -240,7 +251,7 @@ def test_welcome_generates_llm_interpreted_message(mock_get_cursor, mock_get_too
 @patch("src.app.agent_api.routes.generate_welcome_message")
 @patch("src.app.agent_api.routes.get_tool_catalog_safe")
 @patch("src.app.agent_api.routes.DatabaseConnection.get_cursor")
-def test_welcome_stores_session_info_in_conversation_state(mock_get_cursor, mock_get_tool_catalog, mock_generate_welcome):
+def test_welcome_stores_session_info_in_conversation_state(mock_get_cursor, mock_get_tool_catalog, mock_generate_welcome, client):
     """Test that /welcome stores tool_catalog, formats, workflows in conversation state."""
     cursor = MagicMock()
     cursor.fetchall.return_value = [("Modern",), ("Pioneer",)]
@@ -277,7 +288,7 @@ def test_welcome_stores_session_info_in_conversation_state(mock_get_cursor, mock
 
 
 @patch("src.app.agent_api.routes.get_tool_catalog_safe")
-def test_chat_uses_welcome_session_info(mock_get_tool_catalog):
+def test_chat_uses_welcome_session_info(mock_get_tool_catalog, client):
     """Test that /chat can access tool_catalog from welcome session state."""
     # First, manually create a conversation with welcome info
     initial_state = {
@@ -10,7 +10,7 @@ def test_metadata_event_includes_conversation_and_state():
     assert payload.startswith("event: metadata")
     data_line = payload.splitlines()[1]
     assert data_line.startswith("data: ")
-    data = json.loads(data_line.replace("data: ", ""))
+    data = json.loads(data_line[len("data: "):])
     assert data["conversation_id"] == "abc123"
     assert data["format"] == "Modern"
 
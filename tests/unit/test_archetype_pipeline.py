@@ -3,6 +3,7 @@
 import json
 import pytest
 from datetime import datetime
+from typing import List
 from unittest.mock import Mock, patch, MagicMock
 from pydantic import ValidationError
 
@@ -20,6 +21,43 @@ def db_cursor():
         yield cur
 
 
+@pytest.fixture
+def make_test_decklists(db_cursor):
+    """
+    Factory that seeds test tournament/player/decklist rows in one round-trip
+    
+    Call with one or more numbers n; returns the decklist_ids in the same order.
+    """
+    def make(*ns: int) -> List[int]:
+        tournament_ids = [f'test-00{n}' for n in ns]
+        db_cursor.execute("""
+            WITH t AS (
+                INSERT INTO tournaments (tournament_id, tournament_name, format, start_date)
+                SELECT tid, tname, 'Modern', CURRENT_TIMESTAMP
+                FROM unnest(%(tournament_ids)s, %(tournament_names)s) AS s(tid, tname)
+                RETURNING tournament_id
+            ), p AS (
+                INSERT INTO players (player_id, tournament_id, name)
+                SELECT s.pid, t.tournament_id, s.pname
+                FROM unnest(%(tournament_ids)s, %(player_ids)s, %(player_names)s) AS s(tid, pid, pname)
+                JOIN t ON t.tournament_id = s.tid
+                RETURNING player_id, tournament_id
+            )
+            INSERT INTO decklists (player_id, tournament_id)
+            SELECT player_id, tournament_id FROM p
+            RETURNING tournament_id, decklist_id
+        """, {
+            'tournament_ids': tournament_ids,
+            'tournament_names': [f'Test Tournament {n}' for n in ns],
+            'player_ids': [f'p{n}' for n in ns],
+            'player_names': [f'Test Player {n}' for n in ns],
+        })
+        decklist_ids = dict(db_cursor.fetchall())
+        return [decklist_ids[tid] for tid in tournament_ids]
+    
+    return make
+
+
 def test_strategy_check_constraint(db_cursor):
     """Test that strategy column has CHECK constraint for valid values"""
     # Test valid strategy
@@ -41,22 +79,9 @@ def test_strategy_check_constraint(db_cursor):
     assert 'check constraint' in str(exc_info.value).lower()
 
 
-def test_confidence_check_constraint(db_cursor):
+def test_confidence_check_constraint(db_cursor, make_test_decklists):
     """Test that archetype_confidence has CHECK constraint for 0-1 range"""
-    db_cursor.execute("""
-        INSERT INTO tournaments (tournament_id, tournament_name, format, start_date)
-        VALUES ('test-002', 'Test Tournament 2', 'Modern', CURRENT_TIMESTAMP)
-    """)
-    db_cursor.execute("""
-        INSERT INTO players (player_id, tournament_id, name)
-        VALUES ('p2', 'test-002', 'Test Player 2')
-    """)
-    db_cursor.execute("""
-        INSERT INTO decklists (player_id, tournament_id)
-        VALUES ('p2', 'test-002')
-        RETURNING decklist_id
-    """)
-    decklist_id = db_cursor.fetchone()[0]
+    [decklist_id] = make_test_decklists(2)
     
     db_cursor.execute("""
         INSERT INTO archetype_groups (format, main_title, strategy, color_identity)
@@ -92,22 +117,9 @@ def test_confidence_check_constraint(db_cursor):
         assert 'check constraint' in str(e).lower()
 
 
-def test_archetype_classification_foreign_key_cascade(db_cursor):
+def test_archetype_classification_foreign_key_cascade(db_cursor, make_test_decklists):
     """Test that deleting a decklist cascades to archetype_classifications"""
-    db_cursor.execute("""
-        INSERT INTO tournaments (tournament_id, tournament_name, format, start_date)
-        VALUES ('test-003', 'Test Tournament 3', 'Modern', CURRENT_TIMESTAMP)
-    """)
-    db_cursor.execute("""
-        INSERT INTO players (player_id, tournament_id, name)
-        VALUES ('p3', 'test-003', 'Test Player 3')
-    """)
-    db_cursor.execute("""
-        INSERT INTO decklists (player_id, tournament_id)
-        VALUES ('p3', 'test-003')
-        RETURNING decklist_id
-    """)
-    decklist_id = db_cursor.fetchone()[0]
+    [decklist_id] = make_test_decklists(3)
     
     db_cursor.execute("""
         INSERT INTO archetype_groups (format, main_title, strategy, color_identity)
@@ -136,22 +148,9 @@ def test_archetype_classification_foreign_key_cascade(db_cursor):
     assert count == 0, "Classification should be deleted when decklist is deleted (CASCADE)"
 
 
-def test_decklist_archetype_group_id_set_null(db_cursor):
+def test_decklist_archetype_group_id_set_null(db_cursor, make_test_decklists):
     """Test that deleting an archetype_group sets decklists.archetype_group_id to NULL"""
-    db_cursor.execute("""
-        INSERT INTO tournaments (tournament_id, tournament_name, format, start_date)
-        VALUES ('test-004', 'Test Tournament 4', 'Modern', CURRENT_TIMESTAMP)
-    """)
-    db_cursor.execute("""
-        INSERT INTO players (player_id, tournament_id, name)
-        VALUES ('p4', 'test-004', 'Test Player 4')
-    """)
-    db_cursor.execute("""
-        INSERT INTO decklists (player_id, tournament_id)
-        VALUES ('p4', 'test-004')
-        RETURNING decklist_id
-    """)
-    decklist_id = db_cursor.fetchone()[0]
+    [decklist_id] = make_test_decklists(4)
     
     db_cursor.execute("""
         INSERT INTO archetype_groups (format, main_title, strategy, color_identity)
@@ -203,6 +202,33 @@ def test_archetype_indexes_exist(db_cursor):
     assert indexes == expected_indexes, f"Expected indexes {expected_indexes}, got {indexes}"
 
 
+def test_deck_cards_join_indexes_exist(db_cursor):
+    """Test that the decklist -> deck_cards -> cards lookup columns lead an index"""
+    # Match on leading columns rather than index names so primary keys and
+    # unique constraints count as well
+    db_cursor.execute("""
+        SELECT t.relname, array_agg(a.attname::text ORDER BY k.ord)
+        FROM pg_index i
+        JOIN pg_class t ON t.oid = i.indrelid
+        CROSS JOIN LATERAL unnest(i.indkey) WITH ORDINALITY AS k(attnum, ord)
+        JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+        WHERE t.relname IN ('decklists', 'deck_cards', 'cards')
+        GROUP BY t.relname, i.indexrelid
+    """)
+    index_columns = db_cursor.fetchall()
+    
+    required_prefixes = {
+        'decklists': ['player_id', 'tournament_id'],
+        'deck_cards': ['decklist_id'],
+        'cards': ['card_id'],
+    }
+    for table, prefix in required_prefixes.items():
+        assert any(
+            name == table and columns[:len(prefix)] == prefix
+            for name, columns in index_columns
+        ), f"No index on {table} leading with {prefix}"
+
+
 @pytest.fixture
 def pipeline():
     """Create pipeline instance for testing"""
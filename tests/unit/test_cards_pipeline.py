@@ -1,5 +1,8 @@
 """Unit tests for cards_pipeline module"""
 
+import json
+import os
+
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
@@ -744,6 +747,70 @@ def test_transform_card_handles_invalid_legalities(mock_scryfall_client):
     assert transformed['legalities'] == {}
 
 
+BULK_URL = "https://data.scryfall.io/oracle-cards/oracle-cards-20251105100313.json"
+
+
+@pytest.fixture
+def bulk_data_dir(tmp_path):
+    """Point ScryfallClient's bulk data cache at a temporary directory"""
+    from src.clients.scryfall_client import ScryfallClient
+    
+    with patch.object(ScryfallClient, 'DATA_DIR', str(tmp_path)):
+        yield tmp_path / 'oracle_cards'
+
+
+def test_download_bulk_data_uses_cached_file(bulk_data_dir):
+    """Test that an existing snapshot file is loaded instead of re-downloaded"""
+    from src.clients.scryfall_client import ScryfallClient
+    
+    bulk_data_dir.mkdir()
+    cached_file = bulk_data_dir / 'oracle-cards-20251105100313.json'
+    cached_file.write_text(json.dumps([{'id': 'cached'}]), encoding='utf-8')
+    
+    with patch('src.clients.scryfall_client.requests.get') as mock_get:
+        result = ScryfallClient().download_bulk_data('oracle_cards', url=BULK_URL)
+    
+    mock_get.assert_not_called()
+    assert result == {'data': [{'id': 'cached'}], 'file_path': str(cached_file)}
+
+
+def test_download_bulk_data_redownloads_corrupt_cached_file(bulk_data_dir):
+    """Test that an unreadable cached file is replaced by a fresh download"""
+    from src.clients.scryfall_client import ScryfallClient
+    
+    bulk_data_dir.mkdir()
+    cached_file = bulk_data_dir / 'oracle-cards-20251105100313.json'
+    cached_file.write_text('[{"id": "trunc', encoding='utf-8')
+    
+    with patch('src.clients.scryfall_client.requests.get') as mock_get:
+        mock_get.return_value.json.return_value = [{'id': 'fresh'}]
+        result = ScryfallClient().download_bulk_data('oracle_cards', url=BULK_URL)
+    
+    mock_get.assert_called_once()
+    assert result['data'] == [{'id': 'fresh'}]
+    assert json.loads(cached_file.read_text(encoding='utf-8')) == [{'id': 'fresh'}]
+    assert list(bulk_data_dir.iterdir()) == [cached_file]
+
+
+def test_download_bulk_data_saves_missing_file_atomically(bulk_data_dir):
+    """Test that a missing snapshot is downloaded and saved without leaving temp files"""
+    from src.clients.scryfall_client import ScryfallClient
+    
+    with patch('src.clients.scryfall_client.requests.get') as mock_get, \
+         patch('src.clients.scryfall_client.os.replace', wraps=os.replace) as mock_replace:
+        mock_get.return_value.json.return_value = {'data': [{'id': 'fresh'}]}
+        result = ScryfallClient().download_bulk_data('oracle_cards', url=BULK_URL)
+    
+    saved_file = bulk_data_dir / 'oracle-cards-20251105100313.json'
+    assert result == {'data': [{'id': 'fresh'}], 'file_path': str(saved_file)}
+    assert json.loads(saved_file.read_text(encoding='utf-8')) == [{'id': 'fresh'}]
+    # Written to a temporary file in the same folder, then renamed into place
+    tmp_path, final_path = mock_replace.call_args.args
+    assert os.path.dirname(tmp_path) == str(bulk_data_dir)
+    assert final_path == str(saved_file)
+    assert list(bulk_data_dir.iterdir()) == [saved_file]
+
+
 def test_insert_cards_includes_legalities_in_batch_data(pipeline, mock_scryfall_client, mock_db_connection, sample_card_data):
     """Test that batch_data tuples include legalities field"""
     oracle_data = {'data': [sample_card_data]}
@@ -311,6 +311,21 @@ def test_parse_deck_large_quantities():
     assert result[1]['quantity'] == 999
 
 
+def test_parse_deck_large_decklist():
+    """Test parsing a 10,000-line decklist keeps every card, in order and in the right section"""
+    mainboard_lines = [f"4 Test Card {i}" for i in range(5000)]
+    sideboard_lines = [f"2 Sideboard Card {i}" for i in range(4999)]
+    decklist = "\n".join(mainboard_lines + ["Sideboard:"] + sideboard_lines)
+    
+    result = parse_deck(decklist)
+    
+    assert len(result) == 9999
+    assert [c['card_name'] for c in result[:5000]] == [f"Test Card {i}" for i in range(5000)]
+    assert all(c['section'] == 'mainboard' and c['quantity'] == 4 for c in result[:5000])
+    assert [c['card_name'] for c in result[5000:]] == [f"Sideboard Card {i}" for i in range(4999)]
+    assert all(c['section'] == 'sideboard' and c['quantity'] == 2 for c in result[5000:])
+
+
 def test_parse_deck_multiple_sideboard_sections():
     """Test that multiple sideboard sections work correctly"""
     decklist = """4 Lightning Bolt
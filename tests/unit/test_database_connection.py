@@ -0,0 +1,93 @@
+"""Unit tests for database connection module"""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from src.etl.database.connection import DatabaseConnection
+
+
+@pytest.fixture(autouse=True)
+def clear_connection_params_cache():
+    """Ensure each test starts and ends with an empty parameter cache"""
+    DatabaseConnection.close_pool()
+    yield
+    DatabaseConnection.close_pool()
+
+
+def test_connection_params_are_cached(monkeypatch):
+    """Test that connection parameters are read from the environment once"""
+    monkeypatch.setenv('DB_NAME', 'first_db')
+    params = DatabaseConnection._get_connection_params()
+    
+    assert params['database'] == 'first_db'
+    assert DatabaseConnection._get_connection_params() == params
+    
+    # Environment changes are not seen until the cache is cleared
+    monkeypatch.setenv('DB_NAME', 'second_db')
+    assert DatabaseConnection._get_connection_params()['database'] == 'first_db'
+
+
+def test_connection_params_cached_per_database(monkeypatch):
+    """Test that an explicit database gets its own cache entry"""
+    monkeypatch.setenv('DB_NAME', 'app_db')
+    
+    assert DatabaseConnection._get_connection_params()['database'] == 'app_db'
+    assert DatabaseConnection._get_connection_params(database='postgres')['database'] == 'postgres'
+
+
+def test_close_pool_clears_connection_params_cache(monkeypatch):
+    """Test that close_pool picks up environment changes on the next call"""
+    monkeypatch.setenv('DB_NAME', 'first_db')
+    params = DatabaseConnection._get_connection_params()
+    
+    monkeypatch.setenv('DB_NAME', 'second_db')
+    # Still served from the cache until close_pool clears it
+    assert DatabaseConnection._get_connection_params()['database'] == params['database'] == 'first_db'
+    DatabaseConnection.close_pool()
+    
+    refreshed = DatabaseConnection._get_connection_params()
+    assert refreshed['database'] == 'second_db'
+
+
+def test_connection_params_are_returned_as_copies(monkeypatch):
+    """Test that modifying returned parameters does not affect later calls"""
+    monkeypatch.setenv('DB_NAME', 'app_db')
+    params = DatabaseConnection._get_connection_params()
+    params['database'] = 'other_db'
+    
+    assert DatabaseConnection._get_connection_params()['database'] == 'app_db'
+
+
+def test_initialize_pool_rereads_connection_params(monkeypatch):
+    """Test that initialize_pool sees environment changes made after params were cached"""
+    monkeypatch.setenv('DB_NAME', 'app_db')
+    monkeypatch.setenv('DB_USER', 'user')
+    monkeypatch.setenv('DB_PASSWORD', 'password')
+    monkeypatch.setenv('DB_HOST', 'old-host')
+    DatabaseConnection._get_connection_params()
+    
+    created = {}
+    def fake_pool(min_conn, max_conn, **params):
+        created.update(params)
+        return MagicMock()
+    monkeypatch.setattr('src.etl.database.connection.pool.ThreadedConnectionPool', fake_pool)
+    
+    monkeypatch.setenv('DB_HOST', 'new-host')
+    DatabaseConnection.initialize_pool()
+    
+    assert created['host'] == 'new-host'
+
+
+def test_pool_serves_concurrent_cursors():
+    """Test that concurrent callers are each handed a distinct pooled connection"""
+    def backend_pid(_):
+        with DatabaseConnection.get_cursor() as cur:
+            # Hold the connection briefly so the workers overlap
+            cur.execute("SELECT pg_sleep(0.1), pg_backend_pid()")
+            return cur.fetchone()[1]
+    
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        pids = list(executor.map(backend_pid, range(3)))
+    
+    assert len(set(pids)) == 3
@@ -563,7 +563,6 @@ def test_insert_deck_cards_matches_double_faced_cards(pipeline, mock_db_connecti
         ('card_sink',),  # Second card front face match succeeds
     ]
     
-    from unittest.mock import patch
     with patch('src.etl.tournaments_pipeline.DatabaseConnection.transaction') as mock_transaction, \
          patch('src.etl.tournaments_pipeline.parse_deck') as mock_parse, \
          patch('src.etl.tournaments_pipeline.execute_batch'):
@@ -601,7 +600,6 @@ def test_insert_deck_cards_matches_back_face_cards(pipeline, mock_db_connection)
         ('card_tear',),  # Second card back face match succeeds
     ]
     
-    from unittest.mock import patch
     with patch('src.etl.tournaments_pipeline.DatabaseConnection.transaction') as mock_transaction, \
          patch('src.etl.tournaments_pipeline.parse_deck') as mock_parse, \
          patch('src.etl.tournaments_pipeline.execute_batch'):